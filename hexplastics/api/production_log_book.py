@@ -1,11 +1,107 @@
 """API endpoints for Production Log Book."""
 
+import json
+
 import frappe
 from frappe import _
 from frappe.utils import flt
 from datetime import datetime, timedelta
 
 
+def _parse_item_codes(item_codes):
+    """Normalize an item_codes argument from JS into a deduplicated list.
+
+    Uses json.loads directly (C-implemented) instead of frappe.parse_json on
+    this hot whitelisted path, short-circuits empty strings, and drops falsy
+    and duplicate codes while preserving order — a smaller IN (...) clause
+    means fewer values for the DB to probe.
+
+    Args:
+        item_codes (list | str | None): Item codes, possibly JSON-encoded
+
+    Returns:
+        list: Deduplicated item codes
+    """
+    if isinstance(item_codes, str):
+        item_codes = json.loads(item_codes) if item_codes.strip() else []
+
+    seen = set()
+    deduped = []
+    for code in item_codes or []:
+        if code and code not in seen:
+            seen.add(code)
+            deduped.append(code)
+    return deduped
+
+
+_SHIFT_MAP = {"day": "Day", "night": "Night", "both": "Both"}
+
+
+def _normalize_shift(shift):
+    """Normalize a client-supplied shift value once, in one place.
+
+    "Both" collapses to "day" for the priority logic. Previously each
+    priority-lookup function rebuilt its own shift map and lowering logic.
+
+    Args:
+        shift (str): Shift value from the client ("Day", "Night", "Both", ...)
+
+    Returns:
+        tuple: (normalized lowercase token, DB-cased token)
+    """
+    normalized = (shift or "").strip().lower()
+    if normalized == "both":
+        normalized = "day"
+    return normalized, _SHIFT_MAP.get(normalized, "Day")
+
+
+def _load_bom(bom_name, fields="name"):
+    """Fetch BOM fields and validate existence in a single query.
+
+    Replaces the frappe.db.exists + frappe.db.get_value pairs that cost two
+    round trips per call; a None return from get_value already means the BOM
+    does not exist.
+
+    Args:
+        bom_name (str): Name of the BOM document
+        fields (str | list): Field name(s) to fetch
+
+    Returns:
+        The field value (scalar) or a dict when a list of fields is given.
+
+    Raises:
+        frappe.ValidationError: If the BOM does not exist.
+    """
+    as_dict = isinstance(fields, (list, tuple))
+    bom = frappe.db.get_value("BOM", bom_name, fields, as_dict=as_dict)
+    if bom is None:
+        frappe.throw(_("BOM {0} does not exist").format(bom_name))
+    return bom
+
+
+def _request_cached(cache_key, compute):
+    """Memoize a computed value on frappe.local for the current request.
+
+    The Production Log Book form fires several whitelisted calls against the
+    same BOM within one HTTP request; caching on frappe.local turns the
+    repeats into dict lookups. The cache dies with the request, so no
+    invalidation is needed — a BOM cannot change mid-request.
+
+    Args:
+        cache_key (tuple): Hashable key identifying the computation
+        compute (callable): Zero-argument callable producing the value
+
+    Returns:
+        The cached (or freshly computed) value.
+    """
+    cache = getattr(frappe.local, "_plb_bom_cache", None)
+    if cache is None:
+        cache = frappe.local._plb_bom_cache = {}
+    if cache_key not in cache:
+        cache[cache_key] = compute()
+    return cache[cache_key]
+
+
 @frappe.whitelist()
 def get_combined_bom_data(bom_names):
     """Fetch raw-material items and manufacturing-item data for multiple BOMs in one call.
@@ -107,23 +203,25 @@ def get_bom_items_only(bom_name):
         if not bom_name:
             return []
 
-        # Validate that BOM exists
-        if not frappe.db.exists("BOM", bom_name):
-            frappe.throw(_("BOM {0} does not exist").format(bom_name))
+        def fetch():
+            # Validate that BOM exists (single query, no separate exists probe)
+            _load_bom(bom_name)
 
-        # Fetch BOM items from the BOM Item child table
-        bom_items = frappe.get_all(
-            "BOM Item",
-            filters={"parent": bom_name},
-            fields=["item_code", "qty", "uom", "description", "item_name"],
-            order_by="idx",
-        )
+            # Fetch BOM items from the BOM Item child table
+            bom_items = frappe.get_all(
+                "BOM Item",
+                filters={"parent": bom_name},
+                fields=["item_code", "qty", "uom", "description", "item_name"],
+                order_by="idx",
+            )
+
+            # Add item_type flag to each BOM item
+            for item in bom_items:
+                item["item_type"] = "BOM Item"
 
-        # Add item_type flag to each BOM item
-        for item in bom_items:
-            item["item_type"] = "BOM Item"
+            return bom_items or []
 
-        return bom_items or []
+        return _request_cached(("bom_items_only", bom_name), fetch)
 
     except frappe.DoesNotExistError:
         frappe.throw(_("BOM {0} does not exist").format(bom_name))
@@ -156,70 +254,11 @@ def get_bom_main_and_scrap_items(bom_name):
         if not bom_name:
             return {"main_item_code": None, "items": []}
 
-        # Validate that BOM exists
-        if not frappe.db.exists("BOM", bom_name):
-            frappe.throw(_("BOM {0} does not exist").format(bom_name))
-
-        all_items = []
-        main_item_code = None
-
-        # 1. Fetch the main item from BOM doctype
-        bom_doc = frappe.get_doc("BOM", bom_name)
-        if bom_doc.item:
-            main_item_code = bom_doc.item
-            # Get item details if item exists
-            if frappe.db.exists("Item", bom_doc.item):
-                item_doc = frappe.get_doc("Item", bom_doc.item)
-                main_item = {
-                    "item_code": bom_doc.item,
-                    "item_name": item_doc.item_name,
-                    "qty": bom_doc.quantity or 1,
-                    "uom": bom_doc.uom or item_doc.stock_uom,
-                    "description": item_doc.description,
-                    "item_type": "Main Item",
-                }
-                all_items.append(main_item)
-            else:
-                # Item doesn't exist, but still add it with basic info
-                main_item = {
-                    "item_code": bom_doc.item,
-                    "item_name": bom_doc.item,
-                    "qty": bom_doc.quantity or 1,
-                    "uom": bom_doc.uom or "",
-                    "description": "",
-                    "item_type": "Main Item",
-                }
-                all_items.append(main_item)
-
-        # 2. Fetch BOM Scrap Items from the BOM Scrap Item child table
-        # Note: BOM Scrap Item has stock_uom (not uom) and no description field
-        bom_scrap_items = frappe.get_all(
-            "BOM Scrap Item",
-            filters={"parent": bom_name},
-            fields=["item_code", "stock_qty", "stock_uom", "item_name"],
-            order_by="idx",
+        return _request_cached(
+            ("bom_main_and_scrap", bom_name),
+            lambda: _fetch_bom_main_and_scrap_items(bom_name),
         )
 
-        # Normalize field names for consistency with BOM Items
-        for item in bom_scrap_items:
-            # Rename stock_qty to qty for consistency with BOM Items
-            if "stock_qty" in item:
-                item["qty"] = item.pop("stock_qty")
-            # Rename stock_uom to uom for consistency with BOM Items
-            if "stock_uom" in item:
-                item["uom"] = item.pop("stock_uom")
-            # Add description from Item master if item_code exists
-            if item.get("item_code") and frappe.db.exists("Item", item["item_code"]):
-                item["description"] = (
-                    frappe.db.get_value("Item", item["item_code"], "description") or ""
-                )
-            else:
-                item["description"] = ""
-            item["item_type"] = "Scrap Item"
-            all_items.append(item)
-
-        return {"main_item_code": main_item_code, "items": all_items}
-
     except frappe.DoesNotExistError:
         frappe.throw(_("BOM {0} does not exist").format(bom_name))
     except Exception:
@@ -230,6 +269,81 @@ def get_bom_main_and_scrap_items(bom_name):
         frappe.throw(_("Error fetching BOM main and scrap items"))
 
 
+def _fetch_bom_main_and_scrap_items(bom_name):
+    """Build the main-item + scrap-item payload for get_bom_main_and_scrap_items."""
+    all_items = []
+    main_item_code = None
+
+    # 1. Fetch the main item from BOM doctype.
+    # Only three scalar fields are needed, so avoid frappe.get_doc which
+    # would hydrate every BOM child table (items, scrap, operations);
+    # _load_bom also doubles as the existence check.
+    bom = _load_bom(bom_name, ["item", "quantity", "uom"])
+    if bom.item:
+        main_item_code = bom.item
+        # Get item details if item exists
+        item_details = frappe.db.get_value(
+            "Item",
+            bom.item,
+            ["item_name", "stock_uom", "description"],
+            as_dict=True,
+        )
+        if item_details:
+            main_item = {
+                "item_code": bom.item,
+                "item_name": item_details.item_name,
+                "qty": bom.quantity or 1,
+                "uom": bom.uom or item_details.stock_uom,
+                "description": item_details.description,
+                "item_type": "Main Item",
+            }
+            all_items.append(main_item)
+        else:
+            # Item doesn't exist, but still add it with basic info
+            main_item = {
+                "item_code": bom.item,
+                "item_name": bom.item,
+                "qty": bom.quantity or 1,
+                "uom": bom.uom or "",
+                "description": "",
+                "item_type": "Main Item",
+            }
+            all_items.append(main_item)
+
+    # 2. Fetch BOM Scrap Items with the Item description in the same query.
+    # BOM Scrap Item has stock_uom (not uom) and no description field, so the
+    # description comes from a LEFT JOIN on the Item master instead of a
+    # per-row exists + get_value pair (2 queries per scrap row before).
+    bom_scrap_items = frappe.db.sql(
+        """
+        SELECT
+            scrap.item_code,
+            scrap.stock_qty,
+            scrap.stock_uom,
+            scrap.item_name,
+            item.description
+        FROM `tabBOM Scrap Item` scrap
+        LEFT JOIN `tabItem` item ON item.name = scrap.item_code
+        WHERE scrap.parent = %(bom_name)s
+        ORDER BY scrap.idx
+        """,
+        {"bom_name": bom_name},
+        as_dict=True,
+    )
+
+    # Normalize field names for consistency with BOM Items
+    for item in bom_scrap_items:
+        # Rename stock_qty/stock_uom to qty/uom for consistency with BOM Items
+        item["qty"] = item.pop("stock_qty")
+        item["uom"] = item.pop("stock_uom")
+        # Missing Item rows come back as NULL from the LEFT JOIN
+        item["description"] = item.get("description") or ""
+        item["item_type"] = "Scrap Item"
+        all_items.append(item)
+
+    return {"main_item_code": main_item_code, "items": all_items}
+
+
 @frappe.whitelist()
 def get_bom_item_quantities(bom_name, item_codes=None):
     """
@@ -258,37 +372,36 @@ def get_bom_item_quantities(bom_name, item_codes=None):
             return {"bom_qty": 0, "items": []}
 
         # Normalize item_codes (may be JSON string from JS)
-        if isinstance(item_codes, str):
-            item_codes = frappe.parse_json(item_codes)
+        item_codes = _parse_item_codes(item_codes)
 
-        item_codes = item_codes or []
+        def fetch():
+            # Get BOM main quantity (also validates existence in the same query)
+            bom_qty = _load_bom(bom_name, ["name", "quantity"]).quantity or 0
 
-        # Validate that BOM exists
-        if not frappe.db.exists("BOM", bom_name):
-            frappe.throw(_("BOM {0} does not exist").format(bom_name))
+            # If no item codes are provided, we can safely return early
+            if not item_codes:
+                return {"bom_qty": bom_qty or 0, "items": []}
 
-        # Get BOM main quantity (total quantity to produce)
-        bom_qty = frappe.db.get_value("BOM", bom_name, "quantity") or 0
+            # Fetch BOM item quantities only for relevant items
+            bom_items = frappe.get_all(
+                "BOM Item",
+                filters={
+                    "parent": bom_name,
+                    "item_code": ["in", item_codes],
+                },
+                fields=["item_code", "qty"],
+                order_by="idx",
+            )
 
-        # If no item codes are provided, we can safely return early
-        if not item_codes:
-            return {"bom_qty": bom_qty or 0, "items": []}
-
-        # Fetch BOM item quantities only for relevant items
-        bom_items = frappe.get_all(
-            "BOM Item",
-            filters={
-                "parent": bom_name,
-                "item_code": ["in", item_codes],
-            },
-            fields=["item_code", "qty"],
-            order_by="idx",
-        )
+            return {
+                "bom_qty": bom_qty or 0,
+                "items": bom_items or [],
+            }
 
-        return {
-            "bom_qty": bom_qty or 0,
-            "items": bom_items or [],
-        }
+        # item_codes is sorted into the key so list order does not fragment it
+        return _request_cached(
+            ("bom_item_quantities", bom_name, tuple(sorted(item_codes))), fetch
+        )
 
     except frappe.DoesNotExistError:
         frappe.throw(_("BOM {0} does not exist").format(bom_name))
@@ -336,30 +449,29 @@ def calculate_scrap_in_qty(
         if manufactured_qty <= 0:
             return {"in_qty": 0.0}
 
-        # Ensure BOM exists
-        if not frappe.db.exists("BOM", bom_name):
-            frappe.throw(_("BOM {0} does not exist").format(bom_name))
-
-        # Fetch BOM main quantity
-        bom_main_qty = flt(frappe.db.get_value("BOM", bom_name, "quantity")) or 0.0
-        if bom_main_qty <= 0:
-            # Avoid division by zero and invalid BOM state
-            return {"in_qty": 0.0}
-
-        # Fetch scrap quantity for this item from BOM Scrap Item table
-        scrap_rows = frappe.get_all(
-            "BOM Scrap Item",
-            filters={"parent": bom_name, "item_code": item_code},
-            fields=["stock_qty"],
+        # Fetch BOM main quantity and the summed scrap quantity for this item
+        # in a single round trip; the SUM also covers multiple scrap rows for
+        # the same item. An empty result means the BOM does not exist.
+        rows = frappe.db.sql(
+            """
+            SELECT bom.quantity, COALESCE(SUM(scrap.stock_qty), 0)
+            FROM `tabBOM` bom
+            LEFT JOIN `tabBOM Scrap Item` scrap
+                ON scrap.parent = bom.name AND scrap.item_code = %(item_code)s
+            WHERE bom.name = %(bom_name)s
+            GROUP BY bom.quantity
+            """,
+            {"item_code": item_code, "bom_name": bom_name},
         )
 
-        if not scrap_rows:
-            # Item is not present in BOM Scrap table
-            return {"in_qty": 0.0}
+        if not rows:
+            frappe.throw(_("BOM {0} does not exist").format(bom_name))
 
-        # Sum stock_qty in case there are multiple rows for the same item
-        scrap_qty_from_bom = sum(flt(row.stock_qty) for row in scrap_rows) or 0.0
-        if scrap_qty_from_bom <= 0:
+        bom_main_qty = flt(rows[0][0]) or 0.0
+        scrap_qty_from_bom = flt(rows[0][1]) or 0.0
+
+        if bom_main_qty <= 0 or scrap_qty_from_bom <= 0:
+            # Avoid division by zero / item not present in BOM Scrap table
             return {"in_qty": 0.0}
 
         # Apply formula
@@ -408,11 +520,8 @@ def get_previous_closing_stock(
         if not item_code or not current_date or not current_shift:
             return 0.0
 
-        # Normalize shift values
-        current_shift = current_shift.strip().lower()
-        if current_shift == "both":
-            # If "Both", treat as DAY for priority logic
-            current_shift = "day"
+        # Normalize shift values ("Both" is treated as DAY for priority logic)
+        current_shift, _shift_db = _normalize_shift(current_shift)
 
         # Parse current date
         try:
@@ -420,79 +529,11 @@ def get_previous_closing_stock(
         except Exception:
             frappe.throw(_("Invalid date format: {0}").format(current_date))
 
-        # Convert shift to match database values (Day, Night, Both)
-        shift_map = {"day": "Day", "night": "Night", "both": "Both"}
-        current_shift_db = shift_map.get(current_shift, "Day")
-
-        # Build list of date-shift combinations to check in priority order
-        search_sequence = []
-
-        if current_shift == "night":
-            # Step 1: Same date, DAY shift
-            search_sequence.append((current_date_obj, "Day"))
-
-            # Step 2: Previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            # Limit search to last 30 days to avoid infinite loops
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-        else:  # current_shift == "day"
-            # Go directly to previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-
-        # Search through the sequence
-        for check_date_obj, check_shift in search_sequence:
-            # Build filters for Production Log Book
-            filters = {
-                "production_date": check_date_obj,
-                "shift_type": check_shift,
-                "docstatus": 1,  # Only submitted documents
-            }
-
-            # Exclude current document if provided
-            if exclude_docname:
-                filters["name"] = ["!=", exclude_docname]
-
-            # Find Production Log Book documents matching date and shift
-            plb_docs = frappe.get_all(
-                "Production Log Book",
-                filters=filters,
-                fields=["name"],
-                order_by="creation desc",  # Get most recent first
-                limit=1,
-            )
-
-            if plb_docs:
-                plb_name = plb_docs[0].name
-
-                # Search in child table for matching item_code
-                child_rows = frappe.get_all(
-                    "Production Log Book Table",
-                    filters={"parent": plb_name, "item_code": item_code},
-                    fields=["closing_stock"],
-                    limit=1,
-                )
-
-                if child_rows and child_rows[0].closing_stock is not None:
-                    closing_stock = flt(child_rows[0].closing_stock) or 0.0
-                    return closing_stock
-
-        # Nothing found, return 0
-        return 0.0
+        # Delegate to the batched lookup with a single-element list
+        result = _fetch_previous_closing_stocks(
+            [item_code], current_date_obj, current_shift, exclude_docname
+        )
+        return result.get(item_code, 0.0)
 
     except Exception:
         frappe.log_error(
@@ -503,13 +544,166 @@ def get_previous_closing_stock(
         return 0.0
 
 
+def _resolve_from_snapshot(
+    result, item_codes, current_date_obj, current_shift, exclude_docname=None
+):
+    """Answer previous-closing-stock lookups from Item Latest Closing Stock.
+
+    The snapshot stores the globally most recent submitted closing per item,
+    so when that row is admissible for the current (date, shift) slot it is
+    by definition the highest-priority previous entry — an O(1) read instead
+    of the 30-day JOIN scan. Items are left for the fallback scan when:
+    - no snapshot row exists (table not yet populated for this item),
+    - the snapshot points at the excluded (current) document, or
+    - the snapshot is newer than the current slot (backdated entry).
+
+    Args:
+        result (dict): Output dict to fill in-place ({item_code: value})
+        item_codes (list): Item codes to resolve
+        current_date_obj (date): Current production date
+        current_shift (str): Normalized shift ("day" or "night")
+        exclude_docname (str, optional): Document name to exclude
+
+    Returns:
+        list: Item codes the snapshot could not resolve.
+    """
+    snapshots = frappe.get_all(
+        "Item Latest Closing Stock",
+        filters={"item_code": ["in", item_codes]},
+        fields=[
+            "item_code",
+            "plb_name",
+            "production_date",
+            "shift_type",
+            "closing_stock",
+        ],
+    )
+
+    min_date = current_date_obj - timedelta(days=30)
+    resolved = set()
+
+    for snap in snapshots:
+        if exclude_docname and snap.plb_name == exclude_docname:
+            continue
+
+        snap_date = frappe.utils.getdate(snap.production_date)
+        snap_shift = (snap.shift_type or "").strip().lower()
+
+        if snap_date > current_date_obj:
+            continue
+        if snap_date == current_date_obj and not (
+            current_shift == "night" and snap_shift == "day"
+        ):
+            # Same-date rows are only admissible as the DAY document
+            # preceding a NIGHT shift
+            continue
+
+        if snap_date < min_date:
+            # Outside the 30-day lookback window the scan would find
+            # nothing, so mirror its "not found" result
+            result[snap.item_code] = 0.0
+        else:
+            result[snap.item_code] = flt(snap.closing_stock) or 0.0
+        resolved.add(snap.item_code)
+
+    return [code for code in item_codes if code not in resolved]
+
+
+def _fetch_previous_closing_stocks(
+    item_codes, current_date_obj, current_shift, exclude_docname=None
+):
+    """Fetch the most recent closing_stock per item in a single JOIN query.
+
+    A single JOIN between parent and child table, scanning the last 30 days
+    with the shift priority encoded in the ordering — replaces the old
+    per-day Python loop that issued up to 2 queries per (date, shift) pair
+    and per item.
+
+    Priority encoding:
+    - NIGHT shift: same date DAY rows first, then earlier dates
+    - DAY shift: only earlier dates
+    - Within a date: Night before Day, most recent creation first
+
+    Args:
+        item_codes (list): Item codes to look up
+        current_date_obj (date): Current production date
+        current_shift (str): Normalized shift ("day" or "night")
+        exclude_docname (str, optional): Document name to exclude from search
+
+    Returns:
+        dict: {item_code: closing_stock_value, ...} — missing items default to 0.0
+    """
+    result = {code: 0.0 for code in item_codes}
+
+    if not item_codes:
+        return result
+
+    # Try the denormalized snapshot first — a single indexed read per batch.
+    # Items the snapshot cannot answer safely fall through to the scan.
+    remaining = _resolve_from_snapshot(
+        result, item_codes, current_date_obj, current_shift, exclude_docname
+    )
+    if not remaining:
+        return result
+    item_codes = remaining
+
+    min_date = current_date_obj - timedelta(days=30)
+
+    date_shift_predicate = _shift_priority_predicate(current_shift, alias="parent.")
+
+    exclude_predicate = ""
+    if exclude_docname:
+        exclude_predicate = " AND parent.name != %(exclude_docname)s"
+
+    rows = frappe.db.sql(
+        """
+        SELECT t.item_code, t.closing_stock
+        FROM (
+            SELECT
+                child.item_code,
+                child.closing_stock,
+                ROW_NUMBER() OVER (
+                    PARTITION BY child.item_code
+                    ORDER BY {priority_order_by}
+                ) AS rn
+            FROM `tabProduction Log Book Table` child
+            INNER JOIN `tabProduction Log Book` parent
+                ON child.parent = parent.name
+                AND child.item_code IN %(item_codes)s
+                AND child.closing_stock IS NOT NULL
+            WHERE parent.docstatus = 1
+                AND parent.production_date >= %(min_date)s
+                AND {date_shift_predicate}
+                {exclude_predicate}
+        ) t
+        WHERE t.rn = 1
+    """.format(
+            priority_order_by=_shift_priority_order_by(alias="parent."),
+            date_shift_predicate=date_shift_predicate,
+            exclude_predicate=exclude_predicate,
+        ),
+        {
+            "item_codes": tuple(item_codes),
+            "current_date": current_date_obj,
+            "min_date": min_date,
+            "exclude_docname": exclude_docname,
+        },
+    )
+
+    for item_code, closing_stock in rows:
+        result[item_code] = flt(closing_stock) or 0.0
+
+    return result
+
+
 @frappe.whitelist()
 def get_opening_stock_for_items(
     item_codes, current_date, current_shift, exclude_docname=None
 ):
     """
     Get opening stock (previous closing_stock) for multiple items at once.
-    This is more efficient than calling get_previous_closing_stock multiple times.
+    All items are resolved in a single JOIN query instead of calling
+    get_previous_closing_stock in a loop (up to N × 61 queries before).
 
     Args:
         item_codes (list | str): List of item codes (may be JSON string from JS)
@@ -522,24 +716,26 @@ def get_opening_stock_for_items(
     """
     try:
         # Normalize item_codes
-        if isinstance(item_codes, str):
-            item_codes = frappe.parse_json(item_codes)
-
-        item_codes = item_codes or []
+        item_codes = _parse_item_codes(item_codes)
 
         if not item_codes:
             return {}
 
-        result = {}
+        if not current_date or not current_shift:
+            return {code: 0.0 for code in item_codes}
 
-        # Call get_previous_closing_stock for each item
-        for item_code in item_codes:
-            if item_code:
-                result[item_code] = get_previous_closing_stock(
-                    item_code, current_date, current_shift, exclude_docname
-                )
+        # Normalize shift values ("Both" is treated as DAY for priority logic)
+        shift_normalized, _shift_db = _normalize_shift(current_shift)
 
-        return result
+        # Parse current date
+        try:
+            current_date_obj = frappe.utils.getdate(current_date)
+        except Exception:
+            frappe.throw(_("Invalid date format: {0}").format(current_date))
+
+        return _fetch_previous_closing_stocks(
+            item_codes, current_date_obj, shift_normalized, exclude_docname
+        )
 
     except Exception:
         frappe.log_error(
@@ -549,13 +745,144 @@ def get_opening_stock_for_items(
         return {}
 
 
+def _shift_priority_predicate(shift_normalized, alias=""):
+    """Build the WHERE fragment selecting rows older than the current slot.
+
+    NIGHT shift may also read the same-date DAY document; DAY shift only
+    reads earlier dates. Expects %(current_date)s in the query parameters.
+
+    Args:
+        shift_normalized (str): Normalized shift ("day" or "night")
+        alias (str): Optional table alias prefix (e.g. "parent.")
+
+    Returns:
+        str: SQL predicate fragment
+    """
+    if shift_normalized == "night":
+        return """
+            ({alias}production_date < %(current_date)s
+                OR ({alias}production_date = %(current_date)s
+                    AND {alias}shift_type = 'Day'))""".format(alias=alias)
+    return " {alias}production_date < %(current_date)s".format(alias=alias)
+
+
+def _shift_priority_order_by(alias=""):
+    """Build the ORDER BY fragment encoding the shift-priority rule in SQL.
+
+    Most recent date first; within a date Night before Day; ties broken by
+    creation. Shared by the closing-stock and hopper/MIP lookups so the rule
+    lives in exactly one place.
+
+    Args:
+        alias (str): Optional table alias prefix (e.g. "parent.")
+
+    Returns:
+        str: SQL ORDER BY column list (without the ORDER BY keyword)
+    """
+    return """
+        {alias}production_date DESC,
+        CASE {alias}shift_type WHEN 'Night' THEN 0 WHEN 'Day' THEN 1 ELSE 2 END ASC,
+        {alias}creation DESC""".format(alias=alias)
+
+
+def _shift_priority_sequence(current_date_obj, shift_normalized, max_days_back=30):
+    """Yield (date, shift) pairs in shift-priority order, lazily.
+
+    Replaces the eagerly built 60+ tuple list in the Production Log Sheet
+    lookups — callers that find a match on the first probe no longer pay for
+    materializing the whole sequence.
+
+    Priority:
+    - NIGHT shift: same date DAY first, then walk back (Night before Day)
+    - DAY shift: only earlier dates (Night before Day)
+
+    Args:
+        current_date_obj (date): Current production date
+        shift_normalized (str): Normalized shift ("day" or "night")
+        max_days_back (int): How many previous days to walk back
+
+    Yields:
+        tuple: (date, "Night" | "Day")
+    """
+    if shift_normalized == "night":
+        # Step 1: Same date, DAY shift
+        yield current_date_obj, "Day"
+
+    # Step 2: Previous dates (NIGHT → DAY)
+    check_date = current_date_obj - timedelta(days=1)
+    for _day in range(max_days_back):
+        yield check_date, "Night"
+        yield check_date, "Day"
+        check_date = check_date - timedelta(days=1)
+
+
+def _fetch_previous_parent_openings(
+    current_date_obj, current_shift, exclude_docname=None
+):
+    """Fetch closing_qty and closing_qty_mip from the previous Production Log Book.
+
+    One parent-only query with the shift priority encoded in the ordering —
+    the hopper and MIP openings always come from the same (highest priority)
+    previous document, so both fields are read in a single round trip.
+
+    Args:
+        current_date_obj (date): Current production date
+        current_shift (str): Normalized shift ("day" or "night")
+        exclude_docname (str, optional): Document name to exclude from search
+
+    Returns:
+        dict: {"closing_qty": float, "closing_qty_mip": float}
+    """
+    min_date = current_date_obj - timedelta(days=30)
+
+    date_shift_predicate = _shift_priority_predicate(current_shift)
+
+    exclude_predicate = ""
+    if exclude_docname:
+        exclude_predicate = " AND name != %(exclude_docname)s"
+
+    rows = frappe.db.sql(
+        """
+        SELECT closing_qty, closing_qty_mip
+        FROM `tabProduction Log Book`
+        WHERE docstatus = 1
+            AND production_date >= %(min_date)s
+            AND {date_shift_predicate}
+            {exclude_predicate}
+        ORDER BY {priority_order_by}
+        LIMIT 1
+    """.format(
+            date_shift_predicate=date_shift_predicate,
+            priority_order_by=_shift_priority_order_by(),
+            exclude_predicate=exclude_predicate,
+        ),
+        {
+            "current_date": current_date_obj,
+            "min_date": min_date,
+            "exclude_docname": exclude_docname,
+        },
+    )
+
+    if rows:
+        return {
+            "closing_qty": flt(rows[0][0]) or 0.0,
+            "closing_qty_mip": flt(rows[0][1]) or 0.0,
+        }
+
+    return {"closing_qty": 0.0, "closing_qty_mip": 0.0}
+
+
 @frappe.whitelist()
-def get_previous_hopper_opening_qty(
-    current_date: str, current_shift: str, exclude_docname: str | None = None
-) -> float:
+def get_previous_openings(
+    current_date, current_shift, item_codes=None, exclude_docname=None
+):
     """
-    Get the previous hopper closing quantity (used as opening for current doc)
-    based on the same shift-based priority logic as item-wise closing stock.
+    Get hopper opening, MIP opening and per-item opening stocks in one call.
+
+    The three legacy endpoints (get_previous_hopper_opening_qty,
+    get_previous_mip_opening_qty, get_opening_stock_for_items) each repeated
+    the same shift-priority scan; this combined endpoint does one parent
+    lookup plus one child-table JOIN so the form load costs two queries.
 
     Priority Rules:
     - If current_shift = NIGHT:
@@ -565,22 +892,30 @@ def get_previous_hopper_opening_qty(
         1. Go to PREVIOUS DATE (NIGHT → then DAY), continue backwards
 
     Args:
-        current_date: Current production date (YYYY-MM-DD format)
-        current_shift: Current shift type ("Day", "Night", or "Both")
-        exclude_docname: Document name to exclude from search (current document)
+        current_date (str): Current production date (YYYY-MM-DD format)
+        current_shift (str): Current shift type ("Day", "Night", or "Both")
+        item_codes (list | str, optional): Item codes to fetch opening stock for
+            (may be JSON string from JS)
+        exclude_docname (str, optional): Document name to exclude from search
 
     Returns:
-        float: hopper_closing_qty from previous entry, or 0 if not found
+        dict: {
+            "closing_qty": <previous hopper closing qty>,
+            "closing_qty_mip": <previous MIP closing qty>,
+            "items": {item_code: closing_stock_value, ...}
+        }
     """
+    empty = {"closing_qty": 0.0, "closing_qty_mip": 0.0, "items": {}}
+
     try:
         if not current_date or not current_shift:
-            return 0.0
+            return empty
 
-        # Normalize shift values
-        shift_normalized = current_shift.strip().lower()
-        if shift_normalized == "both":
-            # If "Both", treat as DAY for priority logic
-            shift_normalized = "day"
+        # Normalize item_codes (may be JSON string from JS)
+        item_codes = _parse_item_codes(item_codes)
+
+        # Normalize shift values ("Both" is treated as DAY for priority logic)
+        shift_normalized, _shift_db = _normalize_shift(current_shift)
 
         # Parse current date
         try:
@@ -588,88 +923,36 @@ def get_previous_hopper_opening_qty(
         except Exception:
             frappe.throw(_("Invalid date format: {0}").format(current_date))
 
-        # Build list of date-shift combinations to check in priority order
-        search_sequence: list[tuple] = []
-
-        if shift_normalized == "night":
-            # Step 1: Same date, DAY shift
-            search_sequence.append((current_date_obj, "Day"))
-
-            # Step 2: Previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            # Limit search to last 30 days to avoid infinite loops
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-        else:  # shift_normalized == "day"
-            # Go directly to previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-
-        # Search through the sequence
-        for check_date_obj, check_shift in search_sequence:
-            filters: dict = {
-                "production_date": check_date_obj,
-                "shift_type": check_shift,
-                "docstatus": 1,  # Only submitted documents
-            }
-
-            # Exclude current document if provided
-            if exclude_docname:
-                filters["name"] = ["!=", exclude_docname]
-
-            # Find Production Log Book documents matching date and shift
-            plb_docs = frappe.get_all(
-                "Production Log Book",
-                filters=filters,
-                fields=["name", "closing_qty"],
-                order_by="creation desc",  # Get most recent first
-                limit=1,
+        result = _fetch_previous_parent_openings(
+            current_date_obj, shift_normalized, exclude_docname
+        )
+        result["items"] = (
+            _fetch_previous_closing_stocks(
+                item_codes, current_date_obj, shift_normalized, exclude_docname
             )
+            if item_codes
+            else {}
+        )
 
-            if plb_docs:
-                # Use hopper closing quantity from the parent doc
-                closing_qty = plb_docs[0].get("closing_qty")
-                return flt(closing_qty) or 0.0
-
-        # Nothing found, return 0
-        return 0.0
+        return result
 
     except Exception:
         frappe.log_error(
             message=frappe.get_traceback(),
-            title=_("Error fetching previous hopper opening qty"),
+            title=_("Error fetching previous openings"),
         )
-        # Return 0 on error to avoid breaking the form
-        return 0.0
+        return empty
 
 
 @frappe.whitelist()
-def get_previous_mip_opening_qty(
+def get_previous_hopper_opening_qty(
     current_date: str, current_shift: str, exclude_docname: str | None = None
 ) -> float:
     """
-    Get the previous MIP closing quantity (used as opening for current doc)
-    based on the same shift-based priority logic as hopper and item-wise stock.
+    Get the previous hopper closing quantity (used as opening for current doc)
+    based on the same shift-based priority logic as item-wise closing stock.
 
-    Priority Rules:
-    - If current_shift = NIGHT:
-        1. Check SAME DATE → DAY shift
-        2. If not found, go to PREVIOUS DATE (NIGHT → then DAY), continue backwards
-    - If current_shift = DAY:
-        1. Go to PREVIOUS DATE (NIGHT → then DAY), continue backwards
+    Kept for backward compatibility; delegates to get_previous_openings.
 
     Args:
         current_date: Current production date (YYYY-MM-DD format)
@@ -677,84 +960,36 @@ def get_previous_mip_opening_qty(
         exclude_docname: Document name to exclude from search (current document)
 
     Returns:
-        float: closing_qty_mip from previous entry, or 0 if not found
+        float: hopper closing_qty from previous entry, or 0 if not found
     """
-    try:
-        if not current_date or not current_shift:
-            return 0.0
-
-        # Normalize shift values
-        shift_normalized = current_shift.strip().lower()
-        if shift_normalized == "both":
-            shift_normalized = "day"
+    openings = get_previous_openings(
+        current_date, current_shift, exclude_docname=exclude_docname
+    )
+    return openings.get("closing_qty", 0.0)
 
-        # Parse current date
-        try:
-            current_date_obj = frappe.utils.getdate(current_date)
-        except Exception:
-            frappe.throw(_("Invalid date format: {0}").format(current_date))
-
-        # Build list of date-shift combinations to check in priority order
-        search_sequence: list[tuple] = []
-
-        if shift_normalized == "night":
-            # Step 1: Same date, DAY shift
-            search_sequence.append((current_date_obj, "Day"))
-
-            # Step 2: Previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-        else:
-            # Go directly to previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-
-        # Search through the sequence
-        for check_date_obj, check_shift in search_sequence:
-            filters: dict = {
-                "production_date": check_date_obj,
-                "shift_type": check_shift,
-                "docstatus": 1,
-            }
-
-            if exclude_docname:
-                filters["name"] = ["!=", exclude_docname]
 
-            # Find Production Log Book documents matching date and shift
-            plb_docs = frappe.get_all(
-                "Production Log Book",
-                filters=filters,
-                fields=["name", "closing_qty_mip"],
-                order_by="creation desc",
-                limit=1,
-            )
+@frappe.whitelist()
+def get_previous_mip_opening_qty(
+    current_date: str, current_shift: str, exclude_docname: str | None = None
+) -> float:
+    """
+    Get the previous MIP closing quantity (used as opening for current doc)
+    based on the same shift-based priority logic as hopper and item-wise stock.
 
-            if plb_docs:
-                closing_qty_mip = plb_docs[0].get("closing_qty_mip")
-                return flt(closing_qty_mip) or 0.0
+    Kept for backward compatibility; delegates to get_previous_openings.
 
-        return 0.0
+    Args:
+        current_date: Current production date (YYYY-MM-DD format)
+        current_shift: Current shift type ("Day", "Night", or "Both")
+        exclude_docname: Document name to exclude from search (current document)
 
-    except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(),
-            title=_("Error fetching previous MIP opening qty"),
-        )
-        return 0.0
+    Returns:
+        float: closing_qty_mip from previous entry, or 0 if not found
+    """
+    openings = get_previous_openings(
+        current_date, current_shift, exclude_docname=exclude_docname
+    )
+    return openings.get("closing_qty_mip", 0.0)
 
 
 @frappe.whitelist()
@@ -793,7 +1028,7 @@ def get_previous_mip_opening_qty_production_log_sheet(
             return 0.0
 
         # Normalize shift values
-        shift_normalized = current_shift.strip().lower()
+        shift_normalized, _shift_db = _normalize_shift(current_shift)
         if shift_normalized not in {"day", "night"}:
             return 0.0
 
@@ -803,37 +1038,10 @@ def get_previous_mip_opening_qty_production_log_sheet(
         except Exception:
             frappe.throw(_("Invalid date format: {0}").format(current_date))
 
-        # Build list of date-shift combinations to check in priority order
-        search_sequence: list[tuple] = []
-
-        if shift_normalized == "night":
-            # Step 1: Same date, DAY shift
-            search_sequence.append((current_date_obj, "Day"))
-
-            # Step 2: Previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-        else:
-            # Go directly to previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-
-        # Search through the sequence
-        for check_date_obj, check_shift in search_sequence:
+        # Walk date-shift combinations lazily in priority order
+        for check_date_obj, check_shift in _shift_priority_sequence(
+            current_date_obj, shift_normalized
+        ):
             filters: dict = {
                 "production_date": check_date_obj,
                 "shift_type": check_shift,
@@ -884,11 +1092,8 @@ def get_stock_entry_no(docname: str) -> str | None:
         if not docname:
             return None
 
-        # Validate that document exists
-        if not frappe.db.exists("Production Log Book", docname):
-            return None
-
-        # Fetch stock_entry_no from database
+        # get_value already returns None for missing documents, so no
+        # separate exists probe is needed
         stock_entry_no = frappe.db.get_value(
             "Production Log Book", docname, "stock_entry_no"
         )
@@ -926,23 +1131,17 @@ def get_boms_from_production_plan(production_plan: str) -> list:
                 _("Production Plan {0} does not exist").format(production_plan)
             )
 
-        # Fetch BOM names from Production Plan Item child table
-        # Try different possible field names for the child table
-        bom_names = []
-
-        # Standard field name is 'po_items' for Production Plan Item
-        plan_items = frappe.get_all(
+        # Fetch BOM names from Production Plan Item child table; pluck
+        # returns a flat list without per-row dict allocations
+        bom_names = frappe.get_all(
             "Production Plan Item",
             filters={"parent": production_plan},
-            fields=["bom_no"],
+            pluck="bom_no",
             distinct=True,
         )
 
-        # Extract BOM names, filtering out None/empty values
-        bom_names = [item["bom_no"] for item in plan_items if item.get("bom_no")]
-
-        # Remove duplicates and return
-        return list(set(bom_names)) if bom_names else []
+        # Filter out None/empty values (distinct already deduplicated)
+        return [bom_no for bom_no in bom_names if bom_no]
 
     except frappe.DoesNotExistError:
         frappe.throw(_("Production Plan {0} does not exist").format(production_plan))
@@ -993,42 +1192,10 @@ def get_previous_closing_stock_for_production_log_sheet(
         except Exception:
             frappe.throw(_("Invalid date format: {0}").format(current_date))
 
-        # Convert shift to match database values (Day, Night)
-        shift_map = {"day": "Day", "night": "Night"}
-        current_shift_db = shift_map.get(current_shift.lower(), "Day")
-
-        # Build list of date-shift combinations to check in priority order
-        search_sequence = []
-
-        if current_shift.lower() == "night":
-            # Step 1: Same date, DAY shift
-            search_sequence.append((current_date_obj, "Day"))
-
-            # Step 2: Previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            # Limit search to last 30 days to avoid infinite loops
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-        else:  # current_shift == "day"
-            # Go directly to previous dates (NIGHT → DAY)
-            check_date = current_date_obj - timedelta(days=1)
-            max_days_back = 30
-            days_checked = 0
-
-            while days_checked < max_days_back:
-                search_sequence.append((check_date, "Night"))
-                search_sequence.append((check_date, "Day"))
-                check_date = check_date - timedelta(days=1)
-                days_checked += 1
-
-        # Search through the sequence
-        for check_date_obj, check_shift in search_sequence:
+        # Walk date-shift combinations lazily in priority order
+        for check_date_obj, check_shift in _shift_priority_sequence(
+            current_date_obj, current_shift.lower()
+        ):
             # Build filters for Production Log Sheet
             filters = {
                 "production_date": check_date_obj,
@@ -1040,29 +1207,27 @@ def get_previous_closing_stock_for_production_log_sheet(
             if exclude_docname:
                 filters["name"] = ["!=", exclude_docname]
 
-            # Find Production Log Sheet documents matching date and shift
-            pls_docs = frappe.get_all(
+            # Find Production Log Sheet documents matching date and shift;
+            # pluck avoids per-row dict allocations for single-field reads
+            pls_names = frappe.get_all(
                 "Production Log Sheet",
                 filters=filters,
-                fields=["name"],
+                pluck="name",
                 order_by="creation desc",  # Get most recent first
                 limit=1,
             )
 
-            if pls_docs:
-                pls_name = pls_docs[0].name
-
+            if pls_names:
                 # Search in child table for matching item_code
-                child_rows = frappe.get_all(
+                closing_stocks = frappe.get_all(
                     "Production Log Sheet Table",
-                    filters={"parent": pls_name, "item_code": item_code},
-                    fields=["closing_stock"],
+                    filters={"parent": pls_names[0], "item_code": item_code},
+                    pluck="closing_stock",
                     limit=1,
                 )
 
-                if child_rows and child_rows[0].closing_stock is not None:
-                    closing_stock = flt(child_rows[0].closing_stock) or 0.0
-                    return closing_stock
+                if closing_stocks and closing_stocks[0] is not None:
+                    return flt(closing_stocks[0]) or 0.0
 
         # Nothing found, return 0
         return 0.0
@@ -1095,10 +1260,7 @@ def get_opening_stock_for_items_production_log_sheet(
     """
     try:
         # Normalize item_codes
-        if isinstance(item_codes, str):
-            item_codes = frappe.parse_json(item_codes)
-
-        item_codes = item_codes or []
+        item_codes = _parse_item_codes(item_codes)
 
         if not item_codes:
             return {}
@@ -1,8 +1,74 @@
 """API endpoints for Production Log Book Dashboard."""
 
+import hashlib
+import json
+import time
+
 import frappe
 from frappe import _
-from frappe.utils import flt, getdate, add_days
+from frappe.utils import cint, flt, getdate, add_days
+
+# Redis hash holding cached dashboard responses, keyed by filter hash.
+# The TTL is short because the dashboard tolerates slightly stale data and
+# the cache is also dropped explicitly whenever a Production Log Book changes.
+DASHBOARD_CACHE_KEY = "plb_dashboard"
+DASHBOARD_CACHE_TTL = 120
+
+# Filter options change only when a log book with a new manufacturing item
+# is submitted, so they get their own key with a much longer TTL.
+FILTER_OPTIONS_CACHE_KEY = "plb_filter_options"
+FILTER_OPTIONS_CACHE_TTL = 600
+
+
+# Minimum seconds between Error Log inserts for the same failure title.
+ERROR_LOG_DEBOUNCE_TTL = 60
+
+
+def _log_error_debounced(title):
+    """Write an Error Log for this title at most once per debounce window.
+
+    Each failed handler used to insert an Error Log doc per request; during
+    an outage or a malformed-filter storm every dashboard render amplified
+    the load with several INSERTs. A short-lived Redis key per title keeps
+    one traceback per minute, which is plenty to diagnose the incident.
+    """
+    debounce_key = f"plb_err_sampled:{title}"
+    if frappe.cache().get_value(debounce_key):
+        return
+    frappe.cache().set_value(debounce_key, 1, expires_in_sec=ERROR_LOG_DEBOUNCE_TTL)
+    frappe.log_error(message=frappe.get_traceback(), title=title)
+
+
+def _dashboard_cache_key(filters):
+    """Build a stable cache key from the resolved filters dict."""
+    return hashlib.md5(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _get_cached_dashboard(cache_key):
+    """Return a cached dashboard payload, or None when missing/expired."""
+    cached = frappe.cache().hget(DASHBOARD_CACHE_KEY, cache_key)
+    if cached and time.time() - cached.get("cached_at", 0) < DASHBOARD_CACHE_TTL:
+        return cached.get("data")
+    return None
+
+
+def _set_cached_dashboard(cache_key, data):
+    """Store a dashboard payload with its timestamp for TTL checks."""
+    frappe.cache().hset(
+        DASHBOARD_CACHE_KEY, cache_key, {"cached_at": time.time(), "data": data}
+    )
+
+
+def clear_dashboard_cache(doc=None, method=None):
+    """Drop all cached dashboard responses.
+
+    Wired as a doc_events hook on Production Log Book submit/cancel/update
+    so users never see data older than the latest submitted document.
+    """
+    frappe.cache().delete_key(DASHBOARD_CACHE_KEY)
+    frappe.cache().delete_value(FILTER_OPTIONS_CACHE_KEY)
 
 
 @frappe.whitelist()
@@ -24,24 +90,68 @@ def get_dashboard_data(
     try:
         filters = build_filters(from_date, to_date, shift, manufacturing_item)
 
-        return {
-            "overview": get_overview_data(filters),
-            "log_book": get_log_book_data(filters),
-            "entries": get_log_book_entries(filters),
-            "process_loss": get_process_loss_data(filters),
+        # Identical filter sets are served from Redis; the cache is dropped
+        # whenever a Production Log Book is submitted/cancelled/updated
+        cache_key = _dashboard_cache_key(filters)
+        cached = _get_cached_dashboard(cache_key)
+        if cached is not None:
+            return cached
+
+        # Overview, log book and process loss share the same filtered parent
+        # set, so they are computed in one round trip; only the entries list
+        # needs its own per-row query.
+        combined = get_combined_aggregates(filters)
+        # The dashboard page has no paging control yet, so keep its table at
+        # the 100 rows it always showed; smaller pages are for callers that
+        # actually pass start/page_length
+        entries_page = get_log_book_entries(filters, page_length=100)
+
+        data = {
+            "overview": combined["overview"],
+            "log_book": combined["log_book"],
+            "entries": entries_page["entries"],
+            "entries_total": entries_page["total"],
+            "process_loss": combined["process_loss"],
         }
+        _set_cached_dashboard(cache_key, data)
+        return data
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching dashboard data")
-        )
+        _log_error_debounced(_("Error fetching dashboard data"))
         return {
             "overview": get_empty_overview(),
             "log_book": get_empty_log_book(),
             "entries": [],
+            "entries_total": 0,
             "process_loss": {"chart_data": [], "table_data": []},
         }
 
 
+def _summary_filters(filters):
+    """Project a resolved filters dict onto the daily summary table's columns.
+
+    The summary table has no docstatus (only submitted documents feed it),
+    so that key is dropped; the remaining entries are already in frappe's
+    native filter format and pass straight to frappe.get_all.
+    """
+    return {
+        key: value
+        for key, value in filters.items()
+        if key in ("production_date", "shift_type", "manufacturing_item")
+    }
+
+
+def _resolve_filters(filters):
+    """Normalize a handler's filters argument into a dict, parsing at most once.
+
+    Whitelisted handlers receive filters as a JSON string over HTTP but as a
+    ready dict when called internally (e.g. from get_dashboard_data), so a
+    dict passes straight through without re-running json.loads.
+    """
+    if isinstance(filters, str):
+        filters = frappe.parse_json(filters)
+    return filters or {"docstatus": 1}
+
+
 def build_filters(from_date, to_date, shift, manufacturing_item):
     """Build filters dictionary for queries."""
     filters = {"docstatus": 1}  # Only submitted documents
@@ -67,6 +177,137 @@ def build_filters(from_date, to_date, shift, manufacturing_item):
     return filters
 
 
+def get_combined_aggregates(filters):
+    """Compute overview, log book and process loss data in one SQL round trip.
+
+    The aggregates read `tabProduction Log Book Daily Summary` — pre-summed
+    per (date, shift, item) by the submit/cancel hooks — instead of rescanning
+    every submitted Production Log Book and its child rows. The section
+    aggregates come back as UNION ALL branches distinguished by a tag column;
+    Python only dispatches the rows into the section buckets.
+
+    Args:
+        filters (dict): Filters built by build_filters
+
+    Returns:
+        dict: {"overview": {...}, "log_book": {...}, "process_loss": {...}}
+    """
+    where_clause, params = build_where(filters)
+
+    rows = frappe.db.sql(
+        """
+        WITH s_filtered AS (
+            SELECT
+                production_date, shift_type, standard_weight, net_weight,
+                gross_weight, mip_used, process_loss_weight, add_or_used,
+                total_rm_consumption
+            FROM `tabProduction Log Book Daily Summary`
+            WHERE 1 = 1
+                {where_clause}
+        )
+        SELECT 'overview' AS tag, NULL AS date, NULL AS shift_type,
+            ROUND(COALESCE(SUM(s.standard_weight), 0), 2) AS v1,
+            ROUND(COALESCE(SUM(s.net_weight), 0), 2) AS v2,
+            ROUND(COALESCE(SUM(s.process_loss_weight), 0), 2) AS v3,
+            ROUND(COALESCE(SUM(s.mip_used), 0), 2) AS v4
+        FROM s_filtered s
+        UNION ALL
+        SELECT 'log_book', NULL, NULL,
+            ROUND(COALESCE(SUM(s.gross_weight), 0), 2),
+            ROUND(COALESCE(SUM(s.net_weight), 0), 2),
+            ROUND(COALESCE(SUM(s.add_or_used), 0), 2),
+            ROUND(COALESCE(SUM(s.total_rm_consumption), 0), 2)
+        FROM s_filtered s
+        UNION ALL
+        SELECT 'process_loss', s.production_date, s.shift_type,
+            ROUND(COALESCE(SUM(s.process_loss_weight), 0), 2), 0, 0, 0
+        FROM s_filtered s
+        GROUP BY s.production_date, s.shift_type
+        UNION ALL
+        SELECT 'process_loss_chart', s.production_date, NULL,
+            ROUND(COALESCE(SUM(CASE WHEN s.shift_type = 'Day' THEN s.process_loss_weight
+                WHEN s.shift_type = 'Both' THEN s.process_loss_weight / 2
+                ELSE 0 END), 0), 2),
+            ROUND(COALESCE(SUM(CASE WHEN s.shift_type = 'Night' THEN s.process_loss_weight
+                WHEN s.shift_type = 'Both' THEN s.process_loss_weight / 2
+                ELSE 0 END), 0), 2),
+            0, 0
+        FROM s_filtered s
+        GROUP BY s.production_date
+    """.format(where_clause=where_clause),
+        params or None,
+        as_dict=True,
+    )
+
+    overview = get_empty_overview()
+    log_book = get_empty_log_book()
+    process_loss_rows = []
+    process_loss_chart_rows = []
+
+    for row in rows:
+        if row.tag == "overview":
+            overview = {
+                "total_standard_weight": flt(row.v1),
+                "total_net_weight": flt(row.v2),
+                "total_process_loss": flt(row.v3),
+                "total_mip_used": flt(row.v4),
+            }
+        elif row.tag == "log_book":
+            log_book["gross_weight"] = flt(row.v1)
+            log_book["net_weight"] = flt(row.v2)
+            log_book["total_prime_used"] = flt(row.v3)
+            log_book["total_rm_consumption"] = flt(row.v4)
+            # Costing currently uses net_weight as a proxy
+            log_book["total_costing"] = log_book["net_weight"]
+        elif row.tag == "process_loss":
+            process_loss_rows.append(row)
+        elif row.tag == "process_loss_chart":
+            process_loss_chart_rows.append(row)
+
+    return {
+        "overview": overview,
+        "log_book": log_book,
+        "process_loss": build_process_loss_payload(
+            process_loss_rows, process_loss_chart_rows
+        ),
+    }
+
+
+def build_process_loss_payload(table_rows, chart_rows):
+    """Shape SQL-aggregated process loss rows into chart and table data.
+
+    The day/night split (including the even split of "Both" shifts) is done
+    by conditional SUMs in the query, so no Python pivot is needed here —
+    rows are only sorted and renamed.
+
+    Args:
+        table_rows (list): Per-(date, shift) rows with v1 = summed weight
+        chart_rows (list): Per-date rows with v1 = day weight, v2 = night
+
+    Returns:
+        dict: {"chart_data": [...], "table_data": [...]}
+    """
+    table_data = [
+        {
+            "date": row.date,
+            "shift_type": row.shift_type,
+            "weight": flt(row.v1),
+        }
+        for row in sorted(table_rows, key=lambda row: str(row.date))
+    ]
+
+    chart_data = [
+        {
+            "date": str(row.date),
+            "day_weight": flt(row.v1),
+            "night_weight": flt(row.v2),
+        }
+        for row in sorted(chart_rows, key=lambda row: str(row.date))
+    ]
+
+    return {"chart_data": chart_data, "table_data": table_data}
+
+
 def get_empty_overview():
     """Return empty overview data structure."""
     return {
@@ -102,49 +343,35 @@ def get_overview_data(filters=None):
         }
     """
     try:
-        if isinstance(filters, str):
-            filters = frappe.parse_json(filters)
-
-        if not filters:
-            filters = {"docstatus": 1}
-
-        # Get aggregated data from Production Log Book
-        # Calculate total_standard_weight = SUM(manufactured_qty × item.weight_per_unit)
-        data = frappe.db.sql(
-            """
-            SELECT 
-                COALESCE(SUM(pl.manufactured_qty * COALESCE(i.weight_per_unit, 0)), 0) as total_standard_weight,
-                COALESCE(SUM(pl.net_weight), 0) as total_net_weight,
-                COALESCE(SUM(pl.process_loss_weight), 0) as total_process_loss,
-                COALESCE(SUM(pl.mip_used), 0) as total_mip_used
-            FROM `tabProduction Log Book` pl
-            LEFT JOIN `tabItem` i ON pl.manufacturing_item = i.name
-            WHERE pl.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pl"),
-                shift_filter=get_shift_filter_sql(filters, "pl"),
-                item_filter=get_item_filter_sql(filters, "pl"),
-            ),
-            as_dict=True,
+        filters = _resolve_filters(filters)
+
+        # The filters dict already uses frappe's native operator format
+        # (["between", [...]], etc.), so it feeds frappe.get_all directly —
+        # parameterized by the query builder, no SQL string assembly here.
+        # Standard_weight is pre-summed in the daily summary table.
+        data = frappe.get_all(
+            "Production Log Book Daily Summary",
+            filters=_summary_filters(filters),
+            fields=[
+                "SUM(standard_weight) as total_standard_weight",
+                "SUM(net_weight) as total_net_weight",
+                "SUM(process_loss_weight) as total_process_loss",
+                "SUM(mip_used) as total_mip_used",
+            ],
         )
 
         if data and len(data) > 0:
             return {
-                "total_standard_weight": flt(data[0].get("total_standard_weight", 0), 2),
-                "total_net_weight": flt(data[0].get("total_net_weight", 0), 2),
-                "total_process_loss": flt(data[0].get("total_process_loss", 0), 2),
-                "total_mip_used": flt(data[0].get("total_mip_used", 0), 2),
+                "total_standard_weight": flt(data[0].get("total_standard_weight"), 2),
+                "total_net_weight": flt(data[0].get("total_net_weight"), 2),
+                "total_process_loss": flt(data[0].get("total_process_loss"), 2),
+                "total_mip_used": flt(data[0].get("total_mip_used"), 2),
             }
 
         return get_empty_overview()
 
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching overview data")
-        )
+        _log_error_debounced(_("Error fetching overview data"))
         return get_empty_overview()
 
 
@@ -163,78 +390,32 @@ def get_log_book_data(filters=None):
         }
     """
     try:
-        if isinstance(filters, str):
-            filters = frappe.parse_json(filters)
+        filters = _resolve_filters(filters)
 
-        if not filters:
-            filters = {"docstatus": 1}
+        where_clause, params = build_where(filters)
 
-        # Get aggregated data including add_or_used from hopper and tray
+        # The daily summary table carries the child-table consumption sums,
+        # so one statement replaces the old parent + two child-join queries
         data = frappe.db.sql(
             """
-            SELECT 
-                COALESCE(SUM(gross_weight), 0) as gross_weight,
-                COALESCE(SUM(net_weight), 0) as net_weight,
-                COALESCE(SUM(add_or_used), 0) as total_prime_used
-            FROM `tabProduction Log Book`
-            WHERE docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters),
-                shift_filter=get_shift_filter_sql(filters),
-                item_filter=get_item_filter_sql(filters),
-            ),
-            as_dict=True,
-        )
-
-        # Calculate total consumption from child table
-        consumption_data = frappe.db.sql(
-            """
-            SELECT 
-                COALESCE(SUM(plt.consumption), 0) as total_consumption
-            FROM `tabProduction Log Book Table` plt
-            INNER JOIN `tabProduction Log Book` pl ON plt.parent = pl.name
-            WHERE pl.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pl"),
-                shift_filter=get_shift_filter_sql(filters, "pl"),
-                item_filter=get_item_filter_sql(filters, "pl"),
-            ),
-            as_dict=True,
-        )
-
-        # Calculate total RM consumption (only Raw Materials - item_type = 'BOM Item')
-        rm_consumption_data = frappe.db.sql(
-            """
-            SELECT 
-                COALESCE(SUM(plt.consumption), 0) as total_rm_consumption
-            FROM `tabProduction Log Book Table` plt
-            INNER JOIN `tabProduction Log Book` pl ON plt.parent = pl.name
-            WHERE pl.docstatus = 1
-                AND plt.item_type = 'BOM Item'
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pl"),
-                shift_filter=get_shift_filter_sql(filters, "pl"),
-                item_filter=get_item_filter_sql(filters, "pl"),
-            ),
+            SELECT
+                ROUND(COALESCE(SUM(gross_weight), 0), 2) as gross_weight,
+                ROUND(COALESCE(SUM(net_weight), 0), 2) as net_weight,
+                ROUND(COALESCE(SUM(add_or_used), 0), 2) as total_prime_used,
+                ROUND(COALESCE(SUM(total_rm_consumption), 0), 2) as total_rm_consumption
+            FROM `tabProduction Log Book Daily Summary`
+            WHERE 1 = 1
+                {where_clause}
+        """.format(where_clause=where_clause),
+            params or None,
             as_dict=True,
         )
 
-        gross_weight = flt(data[0].get("gross_weight", 0), 2) if data else 0
-        net_weight = flt(data[0].get("net_weight", 0), 2) if data else 0
-        total_prime_used = flt(data[0].get("total_prime_used", 0), 2) if data else 0
+        gross_weight = flt(data[0].get("gross_weight")) if data else 0
+        net_weight = flt(data[0].get("net_weight")) if data else 0
+        total_prime_used = flt(data[0].get("total_prime_used")) if data else 0
         total_rm_consumption = (
-            flt(rm_consumption_data[0].get("total_rm_consumption", 0), 2)
-            if rm_consumption_data
-            else 0
+            flt(data[0].get("total_rm_consumption")) if data else 0
         )
 
         # Calculate costing (simplified - can be enhanced based on requirements)
@@ -250,76 +431,82 @@ def get_log_book_data(filters=None):
         }
 
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching log book data")
-        )
+        _log_error_debounced(_("Error fetching log book data"))
         return get_empty_log_book()
 
 
 @frappe.whitelist()
-def get_log_book_entries(filters=None):
+def get_log_book_entries(filters=None, start=0, page_length=50):
     """
-    Get log book entries for the table view.
+    Get one page of log book entries for the table view.
+
+    Args:
+        filters: Filters dict (or JSON string) built by build_filters
+        start: Row offset of the page
+        page_length: Rows per page
 
     Returns:
-        list: List of log book entries with required columns
+        dict: {entries: list of entry dicts, total: total matching rows}
     """
     try:
-        if isinstance(filters, str):
-            filters = frappe.parse_json(filters)
-
-        if not filters:
-            filters = {"docstatus": 1}
-
-        entries = frappe.db.sql(
+        filters = _resolve_filters(filters)
+
+        where_clause, params = build_where(filters, "pl")
+
+        columns = (
+            "production_log_book_id",
+            "production_date",
+            "shift_type",
+            "manufactured_qty",
+            "net_weight",
+            "mip_used",
+            "process_loss_weight",
+            "total_consumption",
+            "prime_used",
+            "per_piece_rate",
+        )
+        rows = frappe.db.sql(
             """
-            SELECT 
+            SELECT
                 pl.name as production_log_book_id,
                 pl.production_date,
                 pl.shift_type,
-                pl.manufacturing_item,
                 pl.manufactured_qty,
                 pl.net_weight,
                 pl.mip_used,
                 pl.process_loss_weight,
-                (
-                    SELECT COALESCE(SUM(consumption), 0) 
-                    FROM `tabProduction Log Book Table` 
-                    WHERE parent = pl.name
-                ) as total_consumption,
-                COALESCE(pl.add_or_used, 0) as prime_used
+                COALESCE(SUM(plt.consumption), 0) as total_consumption,
+                COALESCE(pl.add_or_used, 0) as prime_used,
+                CASE WHEN pl.manufactured_qty > 0
+                    THEN ROUND(pl.net_weight / pl.manufactured_qty, 4)
+                    ELSE 0
+                END as per_piece_rate,
+                COUNT(*) OVER () as total_rows
             FROM `tabProduction Log Book` pl
+            LEFT JOIN `tabProduction Log Book Table` plt ON plt.parent = pl.name
             WHERE pl.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
+                {where_clause}
+            GROUP BY pl.name
             ORDER BY pl.production_date DESC, pl.production_time DESC
-            LIMIT 100
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pl"),
-                shift_filter=get_shift_filter_sql(filters, "pl"),
-                item_filter=get_item_filter_sql(filters, "pl"),
-            ),
-            as_dict=True,
+            LIMIT %s OFFSET %s
+        """.format(where_clause=where_clause),
+            (params or []) + [cint(page_length), cint(start)],
         )
 
-        # Calculate per piece rate
-        for entry in entries:
-            manufactured_qty = flt(entry.get("manufactured_qty", 0))
-            net_weight = flt(entry.get("net_weight", 0))
+        # COUNT(*) OVER () rides along on every row, so the total comes back
+        # without a second statement; zip() drops it from the entry dicts
+        total = cint(rows[0][-1]) if rows else 0
 
-            if manufactured_qty > 0:
-                entry["per_piece_rate"] = flt(net_weight / manufactured_qty, 4)
-            else:
-                entry["per_piece_rate"] = 0
-
-        return entries
+        # One pass over tuple rows instead of frappe building row dicts and
+        # this function reshaping them again
+        return {
+            "entries": [dict(zip(columns, row)) for row in rows],
+            "total": total,
+        }
 
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching log book entries")
-        )
-        return []
+        _log_error_debounced(_("Error fetching log book entries"))
+        return {"entries": [], "total": 0}
 
 
 @frappe.whitelist()
@@ -334,130 +521,159 @@ def get_process_loss_data(filters=None):
         }
     """
     try:
-        if isinstance(filters, str):
-            filters = frappe.parse_json(filters)
-
-        if not filters:
-            filters = {"docstatus": 1}
-
-        # Get process loss data grouped by date and shift
-        data = frappe.db.sql(
-            """
-            SELECT 
-                production_date as date,
-                shift_type,
-                COALESCE(SUM(process_loss_weight), 0) as weight
-            FROM `tabProduction Log Book`
-            WHERE docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-            GROUP BY production_date, shift_type
-            ORDER BY production_date ASC
-        """.format(
-                date_filter=get_date_filter_sql(filters),
-                shift_filter=get_shift_filter_sql(filters),
-                item_filter=get_item_filter_sql(filters),
-            ),
-            as_dict=True,
-        )
-
-        # Prepare table data
-        table_data = []
-        for row in data:
-            table_data.append(
-                {
-                    "date": row.get("date"),
-                    "shift_type": row.get("shift_type"),
-                    "weight": flt(row.get("weight", 0), 2),
-                }
+        filters = _resolve_filters(filters)
+
+        where_clause, params = build_where(filters)
+
+        # Tuple rows skip the per-row dict allocation frappe does for
+        # as_dict=True; the response dicts below are built only once.
+
+        # Table data: per-(date, shift) sums, already ordered by the query
+        table_data = [
+            {"date": date, "shift_type": shift_type, "weight": flt(weight)}
+            for date, shift_type, weight in frappe.db.sql(
+                """
+                SELECT
+                    production_date,
+                    shift_type,
+                    ROUND(COALESCE(SUM(process_loss_weight), 0), 2)
+                FROM `tabProduction Log Book Daily Summary`
+                WHERE 1 = 1
+                    {where_clause}
+                GROUP BY production_date, shift_type
+                ORDER BY production_date ASC
+            """.format(where_clause=where_clause),
+                params or None,
             )
-
-        # Prepare chart data (grouped by date with day/night comparison)
-        chart_data_map = {}
-        for row in data:
-            date_str = str(row.get("date"))
-            if date_str not in chart_data_map:
-                chart_data_map[date_str] = {
-                    "date": date_str,
-                    "day_weight": 0,
-                    "night_weight": 0,
-                }
-
-            shift = row.get("shift_type", "").lower()
-            weight = flt(row.get("weight", 0), 2)
-
-            if shift == "day":
-                chart_data_map[date_str]["day_weight"] = weight
-            elif shift == "night":
-                chart_data_map[date_str]["night_weight"] = weight
-            elif shift == "both":
-                # Split evenly for "Both" shift
-                chart_data_map[date_str]["day_weight"] += weight / 2
-                chart_data_map[date_str]["night_weight"] += weight / 2
-
-        chart_data = list(chart_data_map.values())
-        chart_data.sort(key=lambda x: x["date"])
+        ]
+
+        # Chart data: the day/night pivot (with "Both" split evenly) is done
+        # by conditional SUMs instead of a Python dict merge
+        chart_data = [
+            {
+                "date": str(date),
+                "day_weight": flt(day_weight),
+                "night_weight": flt(night_weight),
+            }
+            for date, day_weight, night_weight in frappe.db.sql(
+                """
+                SELECT
+                    production_date,
+                    ROUND(COALESCE(SUM(CASE WHEN shift_type = 'Day' THEN process_loss_weight
+                        WHEN shift_type = 'Both' THEN process_loss_weight / 2
+                        ELSE 0 END), 0), 2),
+                    ROUND(COALESCE(SUM(CASE WHEN shift_type = 'Night' THEN process_loss_weight
+                        WHEN shift_type = 'Both' THEN process_loss_weight / 2
+                        ELSE 0 END), 0), 2)
+                FROM `tabProduction Log Book Daily Summary`
+                WHERE 1 = 1
+                    {where_clause}
+                GROUP BY production_date
+                ORDER BY production_date ASC
+            """.format(where_clause=where_clause),
+                params or None,
+            )
+        ]
 
         return {"chart_data": chart_data, "table_data": table_data}
 
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching process loss data")
-        )
+        _log_error_debounced(_("Error fetching process loss data"))
         return {"chart_data": [], "table_data": []}
 
 
+def build_where(filters, table_alias=None):
+    """Combine the date/shift/item filter fragments into one (clause, params).
+
+    One dashboard render calls this several times with the same filters, so
+    the assembled fragment is memoized on frappe.local for the lifetime of
+    the request instead of rebuilding identical strings per handler.
+
+    Args:
+        filters (dict): Filters built by build_filters
+        table_alias (str, optional): Table alias prefix for the columns
+
+    Returns:
+        tuple: (clause, params)
+    """
+    cache = getattr(frappe.local, "_plb_where_cache", None)
+    if cache is None:
+        cache = frappe.local._plb_where_cache = {}
+
+    key = (json.dumps(filters, sort_keys=True, default=str), table_alias)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    date_filter, date_params = get_date_filter_sql(filters, table_alias)
+    shift_filter, shift_params = get_shift_filter_sql(filters, table_alias)
+    item_filter, item_params = get_item_filter_sql(filters, table_alias)
+    cached = (
+        date_filter + shift_filter + item_filter,
+        date_params + shift_params + item_params,
+    )
+    cache[key] = cached
+    return cached
+
+
 def get_date_filter_sql(filters, table_alias=None):
-    """Generate SQL date filter clause."""
+    """Generate SQL date filter clause with %s placeholders.
+
+    Returns:
+        tuple: (clause, params) — params feed frappe.db.sql so the server
+        can reuse the parsed plan instead of seeing a new literal per call.
+    """
     prefix = f"{table_alias}." if table_alias else ""
 
     if not filters:
-        return ""
+        return "", []
 
     date_filter = filters.get("production_date")
     if not date_filter:
-        return ""
+        return "", []
 
     if isinstance(date_filter, list):
         if date_filter[0] == "between" and len(date_filter) > 1:
             dates = date_filter[1]
             if isinstance(dates, list) and len(dates) >= 2:
-                return f" AND {prefix}production_date BETWEEN '{dates[0]}' AND '{dates[1]}'"
+                return (
+                    f" AND {prefix}production_date BETWEEN %s AND %s",
+                    [dates[0], dates[1]],
+                )
         elif date_filter[0] == ">=" and len(date_filter) > 1:
-            return f" AND {prefix}production_date >= '{date_filter[1]}'"
+            return f" AND {prefix}production_date >= %s", [date_filter[1]]
         elif date_filter[0] == "<=" and len(date_filter) > 1:
-            return f" AND {prefix}production_date <= '{date_filter[1]}'"
+            return f" AND {prefix}production_date <= %s", [date_filter[1]]
 
-    return ""
+    return "", []
 
 
 def get_shift_filter_sql(filters, table_alias=None):
-    """Generate SQL shift filter clause."""
+    """Generate SQL shift filter clause with %s placeholders."""
     prefix = f"{table_alias}." if table_alias else ""
 
     if not filters:
-        return ""
+        return "", []
 
     shift_type = filters.get("shift_type")
     if shift_type:
-        return f" AND {prefix}shift_type = '{shift_type}'"
+        return f" AND {prefix}shift_type = %s", [shift_type]
 
-    return ""
+    return "", []
 
 
 def get_item_filter_sql(filters, table_alias=None):
-    """Generate SQL item filter clause."""
+    """Generate SQL item filter clause with %s placeholders."""
     prefix = f"{table_alias}." if table_alias else ""
 
     if not filters:
-        return ""
+        return "", []
 
     manufacturing_item = filters.get("manufacturing_item")
     if manufacturing_item:
-        return f" AND {prefix}manufacturing_item = '{manufacturing_item}'"
+        return f" AND {prefix}manufacturing_item = %s", [manufacturing_item]
 
-    return ""
+    return "", []
 
 
 @frappe.whitelist()
@@ -472,12 +688,19 @@ def get_filter_options():
         }
     """
     try:
+        # The SELECT DISTINCT scan runs on every dashboard render but its
+        # result changes rarely; serve it from Redis and let the doc_events
+        # hooks drop the key when a Production Log Book is submitted
+        cached = frappe.cache().get_value(FILTER_OPTIONS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
         # Get unique manufacturing items from Production Log Book
         items = frappe.db.sql(
             """
             SELECT DISTINCT manufacturing_item
             FROM `tabProduction Log Book`
-            WHERE manufacturing_item IS NOT NULL 
+            WHERE manufacturing_item IS NOT NULL
                 AND manufacturing_item != ''
                 AND docstatus = 1
             ORDER BY manufacturing_item
@@ -485,13 +708,15 @@ def get_filter_options():
             as_dict=True,
         )
 
-        return {
+        options = {
             "shifts": ["All", "Day", "Night"],
             "items": [item.get("manufacturing_item") for item in items],
         }
+        frappe.cache().set_value(
+            FILTER_OPTIONS_CACHE_KEY, options, expires_in_sec=FILTER_OPTIONS_CACHE_TTL
+        )
+        return options
 
     except Exception:
-        frappe.log_error(
-            message=frappe.get_traceback(), title=_("Error fetching filter options")
-        )
+        _log_error_debounced(_("Error fetching filter options"))
         return {"shifts": ["All", "Day", "Night"], "items": []}
@@ -1,8 +1,111 @@
 """API endpoints for Production Log Sheet Dashboard."""
 
+import hashlib
+import json
+import time
+
 import frappe
 from frappe import _
-from frappe.utils import flt, getdate
+from frappe.utils import cint, flt, getdate
+
+# Redis hash holding cached dashboard payloads, keyed by filter hash.
+# Filter combinations repeat heavily (tab toggles, refreshes), so even a
+# short TTL absorbs most loads; the hash is dropped explicitly whenever a
+# Production Log Sheet is submitted or cancelled.
+PLS_DASHBOARD_CACHE_KEY = "pls_dashboard"
+PLS_DASHBOARD_CACHE_TTL = 60
+
+# Shared totals (overview + log book cards) cached per filter hash; both
+# cards project the same aggregate row, so one entry serves both tabs.
+PLS_TOTALS_CACHE_KEY = "pls_totals"
+
+# Filter dropdown options only change when a sheet is submitted/cancelled,
+# so they get a longer TTL than the dashboard payloads.
+PLS_FILTER_OPTIONS_CACHE_KEY = "pls_filter_options"
+PLS_FILTER_OPTIONS_CACHE_TTL = 600
+
+# Redis hash of per-BOM child-item qty sums (bom_no -> SUM(qty)); entries
+# only change when the BOM is submitted or cancelled, which drops them.
+BOM_RM_QTY_CACHE_KEY = "bom_rm_qty"
+
+
+def _dashboard_cache_key(filters):
+    """Build a stable cache key from the resolved filters dict."""
+    return hashlib.sha1(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _get_cached_dashboard(cache_key):
+    """Return a cached dashboard payload, or None when missing/expired."""
+    cached = frappe.cache().hget(PLS_DASHBOARD_CACHE_KEY, cache_key)
+    if cached and time.time() - cached.get("cached_at", 0) < PLS_DASHBOARD_CACHE_TTL:
+        return cached.get("data")
+    return None
+
+
+def _set_cached_dashboard(cache_key, data):
+    """Store a dashboard payload with its timestamp for TTL checks."""
+    frappe.cache().hset(
+        PLS_DASHBOARD_CACHE_KEY, cache_key, {"cached_at": time.time(), "data": data}
+    )
+
+
+def clear_dashboard_cache(doc=None, method=None):
+    """Drop all cached dashboard payloads.
+
+    Wired as a doc_events hook on Production Log Sheet submit/cancel so a
+    fresh submission is visible on the next dashboard load.
+    """
+    frappe.cache().delete_key(PLS_DASHBOARD_CACHE_KEY)
+    frappe.cache().delete_key(PLS_TOTALS_CACHE_KEY)
+    frappe.cache().delete_value(PLS_FILTER_OPTIONS_CACHE_KEY)
+
+
+def clear_bom_rm_cache(doc, method=None):
+    """DocEvent hook (BOM on_submit/on_cancel).
+
+    Drops the cached child-item qty sum for this BOM so actual-vs-planned
+    recomputes it on the next dashboard load.
+    """
+    frappe.cache().hdel(BOM_RM_QTY_CACHE_KEY, doc.name)
+
+
+def _get_bom_item_qty_map(bom_nos):
+    """Per-BOM total child qty, served from a Redis hash.
+
+    The sum over `tabBOM Item` only changes when the BOM itself is
+    submitted or cancelled, so each entry is computed once and reused
+    across actual-vs-planned calls; only cache misses hit the database.
+    """
+    cache = frappe.cache()
+    qty_map = {}
+    misses = []
+    for bom_no in bom_nos:
+        cached = cache.hget(BOM_RM_QTY_CACHE_KEY, bom_no)
+        if cached is not None:
+            qty_map[bom_no] = flt(cached)
+        else:
+            misses.append(bom_no)
+
+    if misses:
+        for parent, total_qty in frappe.db.sql(
+            """
+            SELECT parent, COALESCE(SUM(qty), 0)
+            FROM `tabBOM Item`
+            WHERE parent IN %(bom_nos)s AND docstatus != 2
+            GROUP BY parent
+        """,
+            {"bom_nos": tuple(misses)},
+        ):
+            qty_map[parent] = flt(total_qty)
+
+        # Cache misses too (as 0) so BOMs without rows don't re-query
+        for bom_no in misses:
+            qty_map.setdefault(bom_no, 0)
+            cache.hset(BOM_RM_QTY_CACHE_KEY, bom_no, qty_map[bom_no])
+
+    return qty_map
 
 
 @frappe.whitelist()
@@ -15,14 +118,25 @@ def get_dashboard_data(
             from_date, to_date, shift, manufacturing_item, grade=grade
         )
 
-        return {
-            "overview": get_overview_data(filters),
-            "log_book": get_log_book_data(filters),
+        cache_key = _dashboard_cache_key(filters)
+        cached = _get_cached_dashboard(cache_key)
+        if cached is not None:
+            return cached
+
+        # Overview, log book and process loss share the same filtered rows,
+        # so they are derived from one grouped scan instead of three.
+        combined = get_combined_aggregates(filters)
+
+        data = {
+            "overview": combined["overview"],
+            "log_book": combined["log_book"],
             "entries": get_log_book_entries(filters),
-            "process_loss": get_process_loss_data(filters),
+            "process_loss": combined["process_loss"],
             "actual_vs_planned": get_actual_vs_planned_data(filters),
             "rm_consumption": get_rm_consumption_data(filters),
         }
+        _set_cached_dashboard(cache_key, data)
+        return data
     except Exception:
         frappe.log_error(
             message=frappe.get_traceback(),
@@ -99,54 +213,200 @@ def get_empty_log_book():
     }
 
 
-@frappe.whitelist()
-def get_overview_data(filters=None):
-    """
-    Get overview tab data using Production Log Sheet.
-    """
-    try:
-        if isinstance(filters, str):
-            filters = frappe.parse_json(filters)
+def get_combined_aggregates(filters):
+    """Derive overview, log book and process loss data from one grouped scan.
 
-        if not filters:
-            filters = {"docstatus": 1}
+    The three sections previously issued separate statements with identical
+    WHERE clauses over `tabProduction Log Sheet`. SUM is distributive, so one
+    query grouped by (production_date, shift_type) feeds the per-date/shift
+    process loss rows directly and the section totals by accumulating the
+    group sums in a single Python pass. Only the Stock Entry costing number
+    still needs its own query because of its extra join and docstatus check.
 
-        # Totals: gross / net weight from Finished Good Details (child table), not parent.
-        data = frappe.db.sql(
+    Args:
+        filters (dict): Filters built by build_filters
+
+    Returns:
+        dict: {"overview": {...}, "log_book": {...}, "process_loss": {...}}
+    """
+    if not filters.get("manufacturing_item") and not filters.get("grade"):
+        # Submitted sheets are immutable, so date/shift sums never change
+        # once rolled up — read the small materialized table instead of
+        # scanning every sheet plus its FG child rows.
+        where_clause, params = build_where(filters)
+        rows = frappe.db.sql(
+            """
+            SELECT
+                production_date AS date,
+                shift_type,
+                COALESCE(SUM(sum_gross_weight), 0) AS gross_weight,
+                COALESCE(SUM(sum_net_weight), 0) AS net_weight,
+                COALESCE(SUM(sum_process_loss), 0) AS process_loss_weight,
+                COALESCE(SUM(sum_mip), 0) AS mip_used,
+                COALESCE(SUM(sum_rm), 0) AS total_rm_consumption
+            FROM `tabProduction Log Sheet Daily Rollup`
+            WHERE 1 = 1
+                {where_clause}
+            GROUP BY production_date, shift_type
+            ORDER BY production_date ASC
+        """.format(where_clause=where_clause),
+            params or None,
+            as_dict=True,
+        )
+    else:
+        # Item/grade filters need the FG child rows, which the date/shift
+        # rollup cannot answer — fall back to the base-table scan.
+        fg_join, params = _fg_weights_join_sql(filters)
+        where_clause, where_params = build_where(filters, "pls")
+        params.update(where_params)
+        rows = frappe.db.sql(
             """
             SELECT
-                COALESCE(SUM(COALESCE(fg_w.gross_weight_sum, 0)), 0) AS total_standard_weight,
-                COALESCE(SUM(COALESCE(fg_w.net_weight_sum, 0)), 0) AS total_net_weight,
-                COALESCE(SUM(pls.process_loss_weight), 0) AS total_process_loss,
-                COALESCE(SUM(pls.mip_used), 0) AS total_mip_used
+                pls.production_date AS date,
+                pls.shift_type,
+                COALESCE(SUM(COALESCE(fg_w.gross_weight_sum, 0)), 0) AS gross_weight,
+                COALESCE(SUM(COALESCE(fg_w.net_weight_sum, 0)), 0) AS net_weight,
+                COALESCE(SUM(pls.process_loss_weight), 0) AS process_loss_weight,
+                COALESCE(SUM(pls.mip_used), 0) AS mip_used,
+                COALESCE(SUM(pls.total_rm_consumption), 0) AS total_rm_consumption
             FROM `tabProduction Log Sheet` pls
             {fg_join}
             WHERE pls.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
-        """.format(
-                fg_join=_fg_weights_join_sql(filters),
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
-                grade_filter=get_grade_filter_sql(filters, "pls"),
-            ),
+                {where_clause}
+            GROUP BY pls.production_date, pls.shift_type
+            ORDER BY pls.production_date ASC
+        """.format(fg_join=fg_join, where_clause=where_clause),
+            params or None,
             as_dict=True,
         )
 
-        if data and len(data) > 0:
-            return {
-                "total_standard_weight": flt(
-                    data[0].get("total_standard_weight", 0), 2
-                ),
-                "total_net_weight": flt(data[0].get("total_net_weight", 0), 2),
-                "total_process_loss": flt(data[0].get("total_process_loss", 0), 2),
-                "total_mip_used": flt(data[0].get("total_mip_used", 0), 2),
+    total_gross = total_net = total_loss = total_mip = total_rm = 0.0
+    table_data = []
+    chart_data_map = {}
+
+    for row in rows:
+        gross = flt(row.gross_weight)
+        net = flt(row.net_weight)
+        loss = flt(row.process_loss_weight, 2)
+
+        total_gross += gross
+        total_net += net
+        total_loss += loss
+        total_mip += flt(row.mip_used)
+        total_rm += flt(row.total_rm_consumption)
+
+        table_data.append(
+            {"date": row.date, "shift_type": row.shift_type, "weight": loss}
+        )
+
+        date_str = str(row.date)
+        if date_str not in chart_data_map:
+            chart_data_map[date_str] = {
+                "date": date_str,
+                "day_weight": 0,
+                "night_weight": 0,
             }
 
-        return get_empty_overview()
+        shift = (row.shift_type or "").lower()
+        if shift == "day":
+            chart_data_map[date_str]["day_weight"] += loss
+        elif shift == "night":
+            chart_data_map[date_str]["night_weight"] += loss
+        elif shift == "both":
+            chart_data_map[date_str]["day_weight"] += loss / 2
+            chart_data_map[date_str]["night_weight"] += loss / 2
+
+    overview = {
+        "total_standard_weight": flt(total_gross, 2),
+        "total_net_weight": flt(total_net, 2),
+        "total_process_loss": flt(total_loss, 2),
+        "total_mip_used": flt(total_mip, 2),
+    }
+
+    log_book = {
+        "total_costing": get_total_costing(filters),
+        # Prime used does not exist on Production Log Sheet; keep card but 0
+        "total_prime_used": 0,
+        "total_rm_consumption": flt(total_rm, 2),
+        "gross_weight": flt(total_gross, 2),
+        "net_weight": flt(total_net, 2),
+    }
+
+    # The SQL sorts by date ascending and dicts preserve insertion order,
+    # so the chart rows come out ordered without a Python sort
+    process_loss = {
+        "chart_data": list(chart_data_map.values()),
+        "table_data": table_data,
+    }
+
+    return {
+        "overview": overview,
+        "log_book": log_book,
+        "process_loss": process_loss,
+    }
+
+
+def get_total_costing(filters):
+    """Sum raw-material cost from the Stock Entries linked to filtered sheets."""
+    where_clause, params = build_where(filters, "pls")
+    costing_data = frappe.db.sql(
+        """
+        SELECT
+            COALESCE(SUM(se.total_outgoing_value), 0) AS total_costing
+        FROM `tabProduction Log Sheet` pls
+        INNER JOIN `tabStock Entry` se ON se.name = pls.stock_entry_no
+        WHERE pls.docstatus = 1
+            AND se.docstatus = 1
+            AND pls.stock_entry_no IS NOT NULL
+            {where_clause}
+    """.format(where_clause=where_clause),
+        params or None,
+        as_dict=True,
+    )
+
+    return flt(costing_data[0].get("total_costing", 0), 2) if costing_data else 0
+
+
+def get_totals(filters):
+    """Return the shared overview/log book totals for a filter set, cached.
+
+    Both cards sum the same filtered rows, so the aggregate runs once per
+    filter hash (via get_combined_aggregates) and serves whichever tab asks
+    first; the entry is dropped with the dashboard cache on submit/cancel,
+    with the usual TTL as a backstop.
+    """
+    cache_key = _dashboard_cache_key(filters)
+    cached = frappe.cache().hget(PLS_TOTALS_CACHE_KEY, cache_key)
+    if cached and time.time() - cached.get("cached_at", 0) < PLS_DASHBOARD_CACHE_TTL:
+        return cached.get("data")
+
+    combined = get_combined_aggregates(filters)
+    totals = {
+        "overview": combined["overview"],
+        "log_book": combined["log_book"],
+    }
+    frappe.cache().hset(
+        PLS_TOTALS_CACHE_KEY, cache_key, {"cached_at": time.time(), "data": totals}
+    )
+    return totals
+
+
+@frappe.whitelist()
+def get_overview_data(filters=None):
+    """
+    Get overview tab data using Production Log Sheet.
+
+    Thin projection over get_totals; the log book card shares the same
+    cached aggregate instead of re-summing the rows.
+    """
+    try:
+        if isinstance(filters, str):
+            filters = frappe.parse_json(filters)
+
+        if not filters:
+            filters = {"docstatus": 1}
+
+        return get_totals(filters)["overview"]
 
     except Exception:
         frappe.log_error(
@@ -160,6 +420,9 @@ def get_overview_data(filters=None):
 def get_log_book_data(filters=None):
     """
     Get log book tab data using Production Log Sheet.
+
+    Thin projection over get_totals; the overview card shares the same
+    cached aggregate instead of re-summing the rows.
     """
     try:
         if isinstance(filters, str):
@@ -168,73 +431,7 @@ def get_log_book_data(filters=None):
         if not filters:
             filters = {"docstatus": 1}
 
-        # Gross / net weight from Finished Good Details child table
-        data = frappe.db.sql(
-            """
-            SELECT
-                COALESCE(SUM(COALESCE(fg_w.gross_weight_sum, 0)), 0) AS gross_weight,
-                COALESCE(SUM(COALESCE(fg_w.net_weight_sum, 0)), 0) AS net_weight,
-                COALESCE(SUM(pls.total_rm_consumption), 0) AS total_rm_consumption
-            FROM `tabProduction Log Sheet` pls
-            {fg_join}
-            WHERE pls.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
-        """.format(
-                fg_join=_fg_weights_join_sql(filters),
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
-                grade_filter=get_grade_filter_sql(filters, "pls"),
-            ),
-            as_dict=True,
-        )
-
-        gross_weight = flt(data[0].get("gross_weight", 0), 2) if data else 0
-        net_weight = flt(data[0].get("net_weight", 0), 2) if data else 0
-        total_rm_consumption = (
-            flt(data[0].get("total_rm_consumption", 0), 2) if data else 0
-        )
-
-        # Prime used does not exist on Production Log Sheet; keep card but set to 0
-        total_prime_used = 0
-
-        # Get total costing from linked Stock Entry (total_outgoing_value = cost of raw materials consumed)
-        costing_data = frappe.db.sql(
-            """
-            SELECT
-                COALESCE(SUM(se.total_outgoing_value), 0) AS total_costing
-            FROM `tabProduction Log Sheet` pls
-            INNER JOIN `tabStock Entry` se ON se.name = pls.stock_entry_no
-            WHERE pls.docstatus = 1
-                AND se.docstatus = 1
-                AND pls.stock_entry_no IS NOT NULL
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
-                grade_filter=get_grade_filter_sql(filters, "pls"),
-            ),
-            as_dict=True,
-        )
-
-        total_costing = (
-            flt(costing_data[0].get("total_costing", 0), 2) if costing_data else 0
-        )
-
-        return {
-            "total_costing": total_costing,
-            "total_prime_used": total_prime_used,
-            "total_rm_consumption": total_rm_consumption,
-            "gross_weight": gross_weight,
-            "net_weight": net_weight,
-        }
+        return get_totals(filters)["log_book"]
 
     except Exception:
         frappe.log_error(
@@ -245,9 +442,28 @@ def get_log_book_data(filters=None):
 
 
 @frappe.whitelist()
-def get_log_book_entries(filters=None):
+def get_log_book_entries(
+    filters=None,
+    page_length=100,
+    after_date=None,
+    after_time=None,
+    after_name=None,
+):
     """
-    Get log sheet entries for the table view.
+    Get one page of log sheet entries for the table view.
+
+    Every page — including the first — is ordered by the seek key
+    (production_date, production_time, name) DESC, so the cursor taken
+    from the last row of one page resumes exactly where that page ended.
+    Keyset (seek) pagination has constant cost at any depth, unlike
+    OFFSET which re-reads and discards all prior rows.
+
+    Args:
+        filters: Filters dict (or JSON string) built by build_filters
+        page_length: Rows per page
+        after_date / after_time / after_name: Cursor from the last row of
+            the previous page; all three are required together — a partial
+            cursor is ignored and the first page is returned
     """
     try:
         if isinstance(filters, str):
@@ -256,19 +472,35 @@ def get_log_book_entries(filters=None):
         if not filters:
             filters = {"docstatus": 1}
 
+        params = {"page_length": cint(page_length)}
+
         fgd_item_filter = ""
         if filters.get("manufacturing_item"):
-            fgd_item_filter = (
-                " AND fgd.manufacturing_item = "
-                f"{frappe.db.escape(filters.get('manufacturing_item'))}"
-            )
+            fgd_item_filter = " AND fgd.manufacturing_item = %(fgd_item)s"
+            params["fgd_item"] = filters.get("manufacturing_item")
 
         fgd_grade_filter = "1=1"
         if filters.get("grade"):
             fgd_grade_filter = (
-                "REPLACE(TRIM(IFNULL(fgd.bom_name, '')), '-', '_') = "
-                f"{frappe.db.escape(filters.get('grade'))}"
+                "REPLACE(TRIM(IFNULL(fgd.bom_name, '')), '-', '_') = %(fgd_grade)s"
+            )
+            params["fgd_grade"] = filters.get("grade")
+
+        where_clause, where_params = build_where(filters, "pls")
+        params.update(where_params)
+
+        # The cursor is all-or-nothing: a partial cursor cannot describe a
+        # row in the (date, time, name) seek order, so it is ignored and
+        # the first page is served
+        keyset_filter = ""
+        if after_date and after_time and after_name:
+            keyset_filter = (
+                " AND (pls.production_date, pls.production_time, pls.name)"
+                " < (%(after_date)s, %(after_time)s, %(after_name)s)"
             )
+            params["after_date"] = after_date
+            params["after_time"] = after_time
+            params["after_name"] = after_name
 
         # One row per Production Log Sheet. Grade (bom_name) is the same for all FG rows;
         # show once via MAX. Manufactured qty / net weight are summed across Finished Good Details.
@@ -281,6 +513,13 @@ def get_log_book_entries(filters=None):
                 NULLIF(TRIM(MAX(REPLACE(TRIM(fgd.bom_name), '-', '_'))), '') AS grade,
                 COALESCE(SUM(fgd.manufactured_qty), 0) AS manufactured_qty,
                 COALESCE(SUM(fgd.net_weight), 0) AS net_weight,
+                CASE
+                    WHEN COALESCE(SUM(fgd.manufactured_qty), 0) > 0
+                    THEN ROUND(
+                        COALESCE(SUM(fgd.net_weight), 0)
+                        / SUM(fgd.manufactured_qty), 4)
+                    ELSE 0
+                END AS per_piece_rate,
                 COALESCE(pls.total_production_weight, 0) AS total_production_weight,
                 pls.mip_used,
                 pls.process_loss_weight,
@@ -292,10 +531,9 @@ def get_log_book_entries(filters=None):
                 AND fgd.parentfield = 'table_foun'
                 AND ({fgd_grade_filter})
             WHERE pls.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
+                {where_clause}
                 {fgd_item_filter}
+                {keyset_filter}
             GROUP BY
                 pls.name,
                 pls.production_date,
@@ -305,30 +543,18 @@ def get_log_book_entries(filters=None):
                 pls.mip_used,
                 pls.process_loss_weight,
                 pls.total_rm_consumption
-            ORDER BY
-                (IFNULL(TRIM(MAX(REPLACE(TRIM(fgd.bom_name), '-', '_'))), '') = '') ASC,
-                TRIM(MAX(REPLACE(TRIM(fgd.bom_name), '-', '_'))) ASC,
-                pls.production_date DESC,
-                pls.production_time DESC
+            ORDER BY pls.production_date DESC, pls.production_time DESC, pls.name DESC
+            LIMIT %(page_length)s
         """.format(
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
+                where_clause=where_clause,
                 fgd_item_filter=fgd_item_filter,
                 fgd_grade_filter=fgd_grade_filter,
+                keyset_filter=keyset_filter,
             ),
+            params or None,
             as_dict=True,
         )
 
-        for entry in entries:
-            manufactured_qty = flt(entry.get("manufactured_qty", 0))
-            net_weight = flt(entry.get("net_weight", 0))
-
-            if manufactured_qty > 0:
-                entry["per_piece_rate"] = flt(net_weight / manufactured_qty, 4)
-            else:
-                entry["per_piece_rate"] = 0
-
         return entries
 
     except Exception:
@@ -351,64 +577,58 @@ def get_process_loss_data(filters=None):
         if not filters:
             filters = {"docstatus": 1}
 
-        data = frappe.db.sql(
+        where_clause, params = build_where(filters)
+
+        # Per-date/shift rows for the table, rounded in the projection
+        table_data = frappe.db.sql(
             """
             SELECT
                 production_date AS date,
                 shift_type,
-                COALESCE(SUM(process_loss_weight), 0) AS weight
+                ROUND(COALESCE(SUM(process_loss_weight), 0), 2) AS weight
             FROM `tabProduction Log Sheet`
             WHERE docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
+                {where_clause}
             GROUP BY production_date, shift_type
             ORDER BY production_date ASC
-        """.format(
-                date_filter=get_date_filter_sql(filters),
-                shift_filter=get_shift_filter_sql(filters),
-                item_filter=get_item_filter_sql(filters),
-                grade_filter=get_grade_filter_sql(filters, None),
-            ),
+        """.format(where_clause=where_clause),
+            params or None,
             as_dict=True,
         )
 
-        table_data = []
-        for row in data:
-            table_data.append(
-                {
-                    "date": row.get("date"),
-                    "shift_type": row.get("shift_type"),
-                    "weight": flt(row.get("weight", 0), 2),
-                }
-            )
-
-        chart_data_map = {}
-        for row in data:
-            date_str = str(row.get("date"))
-            if date_str not in chart_data_map:
-                chart_data_map[date_str] = {
-                    "date": date_str,
-                    "day_weight": 0,
-                    "night_weight": 0,
-                }
-
-            shift = (row.get("shift_type") or "").lower()
-            weight = flt(row.get("weight", 0), 2)
-
-            if shift == "day":
-                chart_data_map[date_str]["day_weight"] = weight
-            elif shift == "night":
-                chart_data_map[date_str]["night_weight"] = weight
-            elif shift == "both":
-                chart_data_map[date_str]["day_weight"] += weight / 2
-                chart_data_map[date_str]["night_weight"] += weight / 2
+        # Conditional SUMs pivot the day/night chart in SQL, splitting the
+        # 'Both' shift evenly — no Python dict churn afterwards
+        chart_data = frappe.db.sql(
+            """
+            SELECT
+                production_date AS date,
+                ROUND(COALESCE(SUM(CASE
+                    WHEN LOWER(shift_type) = 'day' THEN process_loss_weight
+                    WHEN LOWER(shift_type) = 'both' THEN process_loss_weight / 2
+                    ELSE 0
+                END), 0), 2) AS day_weight,
+                ROUND(COALESCE(SUM(CASE
+                    WHEN LOWER(shift_type) = 'night' THEN process_loss_weight
+                    WHEN LOWER(shift_type) = 'both' THEN process_loss_weight / 2
+                    ELSE 0
+                END), 0), 2) AS night_weight
+            FROM `tabProduction Log Sheet`
+            WHERE docstatus = 1
+                {where_clause}
+            GROUP BY production_date
+            ORDER BY production_date ASC
+        """.format(where_clause=where_clause),
+            params or None,
+            as_dict=True,
+        )
 
-        chart_data = list(chart_data_map.values())
-        chart_data.sort(key=lambda x: x["date"])
+        for row in chart_data:
+            row["date"] = str(row["date"])
 
-        return {"chart_data": chart_data, "table_data": table_data}
+        return {
+            "chart_data": chart_data,
+            "table_data": table_data,
+        }
 
     except Exception:
         frappe.log_error(
@@ -418,59 +638,92 @@ def get_process_loss_data(filters=None):
         return {"chart_data": [], "table_data": []}
 
 
+def build_where(filters, table_alias=None):
+    """Combine the date/shift/item/grade fragments into one (clause, params).
+
+    Args:
+        filters (dict): Filters built by build_filters
+        table_alias (str, optional): Table alias prefix for the columns
+
+    Returns:
+        tuple: (clause, params) — params bind via frappe.db.sql so the
+        server sees one parameterized statement per filter shape instead of
+        a new literal per call.
+    """
+    clause = ""
+    params = {}
+    for fragment, fragment_params in (
+        get_date_filter_sql(filters, table_alias),
+        get_shift_filter_sql(filters, table_alias),
+        get_item_filter_sql(filters, table_alias),
+        get_grade_filter_sql(filters, table_alias),
+    ):
+        clause += fragment
+        params.update(fragment_params)
+    return clause, params
+
+
 def get_date_filter_sql(filters, table_alias=None):
-    """Generate SQL date filter clause."""
+    """Generate SQL date filter clause with bind parameters."""
     prefix = f"{table_alias}." if table_alias else ""
 
     if not filters:
-        return ""
+        return "", {}
 
     date_filter = filters.get("production_date")
     if not date_filter:
-        return ""
+        return "", {}
 
     if isinstance(date_filter, list):
         if date_filter[0] == "between" and len(date_filter) > 1:
             dates = date_filter[1]
             if isinstance(dates, list) and len(dates) >= 2:
-                return f" AND {prefix}production_date BETWEEN '{dates[0]}' AND '{dates[1]}'"
+                return (
+                    f" AND {prefix}production_date BETWEEN %(from_date)s AND %(to_date)s",
+                    {"from_date": dates[0], "to_date": dates[1]},
+                )
         elif date_filter[0] == ">=" and len(date_filter) > 1:
-            return f" AND {prefix}production_date >= '{date_filter[1]}'"
+            return (
+                f" AND {prefix}production_date >= %(from_date)s",
+                {"from_date": date_filter[1]},
+            )
         elif date_filter[0] == "<=" and len(date_filter) > 1:
-            return f" AND {prefix}production_date <= '{date_filter[1]}'"
+            return (
+                f" AND {prefix}production_date <= %(to_date)s",
+                {"to_date": date_filter[1]},
+            )
 
-    return ""
+    return "", {}
 
 
 def get_shift_filter_sql(filters, table_alias=None):
-    """Generate SQL shift filter clause."""
+    """Generate SQL shift filter clause with bind parameters."""
     prefix = f"{table_alias}." if table_alias else ""
 
     if not filters:
-        return ""
+        return "", {}
 
     shift_type = filters.get("shift_type")
     if shift_type:
-        return f" AND {prefix}shift_type = '{shift_type}'"
+        return f" AND {prefix}shift_type = %(shift_type)s", {"shift_type": shift_type}
 
-    return ""
+    return "", {}
 
 
 def get_item_filter_sql(filters, table_alias=None):
-    """Generate SQL item filter clause.
+    """Generate SQL item filter clause with bind parameters.
 
     Manufacturing item (and gross/net weight) live on Finished Good Details
     (``Production Log Sheet FG Details Table``, parentfield ``table_foun``),
     so filter with EXISTS on the child table instead of a parent column.
     """
     if not filters:
-        return ""
+        return "", {}
 
     manufacturing_item = filters.get("manufacturing_item")
     if not manufacturing_item:
-        return ""
+        return "", {}
 
-    esc = frappe.db.escape(manufacturing_item)
     parent_ref = f"{table_alias}.name" if table_alias else "`tabProduction Log Sheet`.name"
     return (
         " AND EXISTS ("
@@ -478,17 +731,17 @@ def get_item_filter_sql(filters, table_alias=None):
         f"WHERE fg_mfg.parent = {parent_ref} "
         "AND fg_mfg.parenttype = 'Production Log Sheet' "
         "AND fg_mfg.parentfield = 'table_foun' "
-        f"AND fg_mfg.manufacturing_item = {esc}"
-        ")"
+        "AND fg_mfg.manufacturing_item = %(mfg_item)s"
+        ")",
+        {"mfg_item": manufacturing_item},
     )
 
 
 def get_grade_filter_sql(filters, table_alias="pls"):
     """Restrict to Production Log Sheets that have a Finished Good Details row with this grade."""
     if not filters or not filters.get("grade"):
-        return ""
+        return "", {}
 
-    esc = frappe.db.escape(filters["grade"])
     parent_ref = f"{table_alias}.name" if table_alias else "`tabProduction Log Sheet`.name"
     return (
         " AND EXISTS ("
@@ -496,20 +749,27 @@ def get_grade_filter_sql(filters, table_alias="pls"):
         f"WHERE fg_grade.parent = {parent_ref} "
         "AND fg_grade.parenttype = 'Production Log Sheet' "
         "AND fg_grade.parentfield = 'table_foun' "
-        f"AND REPLACE(TRIM(IFNULL(fg_grade.bom_name, '')), '-', '_') = {esc}"
-        ")"
+        "AND REPLACE(TRIM(IFNULL(fg_grade.bom_name, '')), '-', '_') = %(grade)s"
+        ")",
+        {"grade": filters["grade"]},
     )
 
 
 def _fg_weights_join_sql(filters=None):
-    """Subquery join: per Production Log Sheet, sum gross/net from Finished Good Details."""
+    """Subquery join: per Production Log Sheet, sum gross/net from Finished Good Details.
+
+    Returns:
+        tuple: (join_sql, params)
+    """
     grade_clause = ""
+    params = {}
     if filters and filters.get("grade"):
-        esc = frappe.db.escape(filters["grade"])
         grade_clause = (
-            " AND REPLACE(TRIM(IFNULL(bom_name, '')), '-', '_') = " + esc
+            " AND REPLACE(TRIM(IFNULL(bom_name, '')), '-', '_') = %(grade)s"
         )
-    return """
+        params["grade"] = filters["grade"]
+    return (
+        """
         LEFT JOIN (
             SELECT
                 parent,
@@ -521,7 +781,9 @@ def _fg_weights_join_sql(filters=None):
                 {grade_clause}
             GROUP BY parent
         ) fg_w ON fg_w.parent = pls.name
-    """.format(grade_clause=grade_clause)
+    """.format(grade_clause=grade_clause),
+        params,
+    )
 
 
 @frappe.whitelist()
@@ -542,19 +804,22 @@ def get_actual_vs_planned_data(filters=None):
 
         # Actuals grouped by grade (BOM Grade = bom_name on Finished Good Details).
         # One sub-row per Production Log Sheet, then summed by grade. RM per document once.
+        actual_params = {}
+
         fg_item_filter = ""
         if filters.get("manufacturing_item"):
-            fg_item_filter = (
-                " AND fg.manufacturing_item = "
-                f"{frappe.db.escape(filters.get('manufacturing_item'))}"
-            )
+            fg_item_filter = " AND fg.manufacturing_item = %(fg_item)s"
+            actual_params["fg_item"] = filters.get("manufacturing_item")
 
         fg_grade_filter = ""
         if filters.get("grade"):
             fg_grade_filter = (
-                " AND REPLACE(TRIM(IFNULL(fg.bom_name, '')), '-', '_') = "
-                f"{frappe.db.escape(filters.get('grade'))}"
+                " AND REPLACE(TRIM(IFNULL(fg.bom_name, '')), '-', '_') = %(fg_grade)s"
             )
+            actual_params["fg_grade"] = filters.get("grade")
+
+        where_clause, where_params = build_where(filters, "pls")
+        actual_params.update(where_params)
 
         actual_data = frappe.db.sql(
             """
@@ -576,21 +841,18 @@ def get_actual_vs_planned_data(filters=None):
                     AND fg.parenttype = 'Production Log Sheet'
                     AND fg.parentfield = 'table_foun'
                 WHERE pls.docstatus = 1
-                    {date_filter}
-                    {shift_filter}
-                    {item_filter}
+                    {where_clause}
                     {fg_item_filter}
                     {fg_grade_filter}
                 GROUP BY pls.name
             ) s
             GROUP BY s.grade
         """.format(
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
+                where_clause=where_clause,
                 fg_item_filter=fg_item_filter,
                 fg_grade_filter=fg_grade_filter,
             ),
+            actual_params or None,
             as_dict=True,
         )
 
@@ -615,28 +877,25 @@ def get_actual_vs_planned_data(filters=None):
             FROM `tabProduction Log Sheet` pls
             WHERE pls.docstatus = 1
                 AND pls.production_plan IS NOT NULL
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
-                grade_filter=get_grade_filter_sql(filters, "pls"),
-            ),
+                {where_clause}
+        """.format(where_clause=where_clause),
+            where_params or None,
             as_dict=True,
         )
 
-        all_plan_items = []
-        for plan_row in production_plans:
-            production_plan = plan_row.get("production_plan")
-            if not production_plan:
-                continue
+        # Bulk-fetch plan items, BOM headers and BOM item sums up front —
+        # the old per-plan / per-plan-item lookups were a classic N+1
+        plan_names = [
+            row.get("production_plan")
+            for row in production_plans
+            if row.get("production_plan")
+        ]
 
-            plan_items = frappe.get_all(
+        all_plan_items = []
+        if plan_names:
+            all_plan_items = frappe.get_all(
                 "Production Plan Item",
-                filters={"parent": production_plan, "docstatus": ["!=", 2]},
+                filters={"parent": ["in", plan_names], "docstatus": ["!=", 2]},
                 fields=[
                     "item_code",
                     "planned_qty",
@@ -645,17 +904,21 @@ def get_actual_vs_planned_data(filters=None):
                     "custom_bom_name",
                 ],
             )
-            all_plan_items.extend(plan_items)
 
         bom_nos = {pi.get("bom_no") for pi in all_plan_items if pi.get("bom_no")}
         bom_grade_map = {}
+        bom_map = {}
+        bom_item_qty_map = {}
         if bom_nos:
             for b in frappe.get_all(
                 "BOM",
                 filters={"name": ["in", list(bom_nos)]},
-                fields=["name", "custom_bom_name"],
+                fields=["name", "custom_bom_name", "quantity", "docstatus"],
             ):
                 bom_grade_map[b.name] = normalize_bom_grade(b.get("custom_bom_name"))
+                bom_map[b.name] = b
+
+            bom_item_qty_map = _get_bom_item_qty_map(bom_nos)
 
         planned_grades_map = {}
         mi_filter = filters.get("manufacturing_item")
@@ -690,9 +953,7 @@ def get_actual_vs_planned_data(filters=None):
             planned_grades_map[grade_key]["planned_fg_weight"] += planned_fg_weight
 
             if bom_no:
-                bom_data = frappe.db.get_value(
-                    "BOM", bom_no, ["quantity", "docstatus"], as_dict=True
-                )
+                bom_data = bom_map.get(bom_no)
 
                 if not bom_data or bom_data.get("docstatus") != 1:
                     continue
@@ -702,22 +963,9 @@ def get_actual_vs_planned_data(filters=None):
                 if bom_quantity <= 0:
                     continue
 
-                bom_items = frappe.get_all(
-                    "BOM Item",
-                    filters={"parent": bom_no, "docstatus": ["!=", 2]},
-                    fields=["item_code", "qty"],
-                )
-
-                planned_rm_for_this_item = 0
-                for bom_item in bom_items:
-                    bom_item_qty = flt(bom_item.get("qty", 0), 4)
-
-                    if bom_item_qty > 0 and bom_quantity > 0:
-                        rm_consumption = (bom_item_qty / bom_quantity) * planned_qty
-                        planned_rm_for_this_item += flt(rm_consumption, 4)
-
+                bom_rm_per_unit = bom_item_qty_map.get(bom_no, 0) / bom_quantity
                 planned_grades_map[grade_key]["planned_rm_consumption"] += flt(
-                    planned_rm_for_this_item, 2
+                    bom_rm_per_unit * planned_qty, 2
                 )
 
         # Combine actual and planned data; sort by grade (blank last)
@@ -726,7 +974,8 @@ def get_actual_vs_planned_data(filters=None):
         if filters.get("grade"):
             all_grades = {filters["grade"]}
         else:
-            all_grades = set(actual_grades_map.keys()) | set(planned_grades_map.keys())
+            # dict keys views support set union directly — no intermediate sets
+            all_grades = actual_grades_map.keys() | planned_grades_map.keys()
 
         def _grade_sort_key(g):
             return (not g, g.lower())
@@ -769,6 +1018,7 @@ def get_rm_consumption_data(filters=None):
         if not filters:
             filters = {"docstatus": 1}
 
+        where_clause, params = build_where(filters, "pls")
         data = frappe.db.sql(
             """
             SELECT
@@ -781,22 +1031,15 @@ def get_rm_consumption_data(filters=None):
                 AND rm.parenttype = 'Production Log Sheet'
                 AND rm.parentfield = 'raw_material_consumption'
             WHERE pls.docstatus = 1
-                {date_filter}
-                {shift_filter}
-                {item_filter}
-                {grade_filter}
+                {where_clause}
             GROUP BY
                 COALESCE(NULLIF(TRIM(rm.item_name), ''), rm.item_code),
                 COALESCE(NULLIF(TRIM(rm.stock_uom), ''), '-')
             ORDER BY
                 COALESCE(NULLIF(TRIM(rm.item_name), ''), rm.item_code) ASC,
                 COALESCE(NULLIF(TRIM(rm.stock_uom), ''), '-') ASC
-        """.format(
-                date_filter=get_date_filter_sql(filters, "pls"),
-                shift_filter=get_shift_filter_sql(filters, "pls"),
-                item_filter=get_item_filter_sql(filters, "pls"),
-                grade_filter=get_grade_filter_sql(filters, "pls"),
-            ),
+        """.format(where_clause=where_clause),
+            params or None,
             as_dict=True,
         )
 
@@ -821,8 +1064,16 @@ def get_rm_consumption_data(filters=None):
 def get_filter_options():
     """
     Get filter dropdown options using Production Log Sheet.
+
+    Options only change when a sheet is submitted or cancelled, so the two
+    DISTINCT scans are served from Redis; the submit/cancel hook drops the
+    key and the TTL covers anything that slips through.
     """
     try:
+        cached = frappe.cache().get_value(PLS_FILTER_OPTIONS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
         items = frappe.db.sql(
             """
             SELECT DISTINCT fg.manufacturing_item AS manufacturing_item
@@ -854,11 +1105,17 @@ def get_filter_options():
 
         grade_list = [r.get("grade") for r in grades if r.get("grade")]
 
-        return {
+        options = {
             "shifts": ["All", "Day", "Night"],
             "items": [item.get("manufacturing_item") for item in items],
             "grades": grade_list,
         }
+        frappe.cache().set_value(
+            PLS_FILTER_OPTIONS_CACHE_KEY,
+            options,
+            expires_in_sec=PLS_FILTER_OPTIONS_CACHE_TTL,
+        )
+        return options
 
     except Exception:
         frappe.log_error(
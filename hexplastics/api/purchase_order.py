@@ -1,6 +1,26 @@
 """API endpoints for Purchase Order."""
 
 import frappe
+from frappe.utils import flt
+
+# The answer only changes when a Purchase Order for the item is submitted
+# or cancelled, and those events drop the key — the TTL is just a backstop.
+AVG_RATE_CACHE_TTL = 3600
+
+
+def _avg_rate_cache_key(item_code):
+	return f"po_avg5:{item_code}"
+
+
+def clear_avg_rate_cache(doc, method=None):
+	"""DocEvent hook (Purchase Order on_submit/on_cancel).
+
+	Drops the cached last-5 average for every item on the order, since a
+	new or cancelled submission changes their answer.
+	"""
+	for item in doc.get("items") or []:
+		if item.item_code:
+			frappe.cache().delete_value(_avg_rate_cache_key(item.item_code))
 
 
 @frappe.whitelist()
@@ -15,43 +35,90 @@ def get_last_5_avg_rate(item_code):
 	    float: Average rate from last 5 purchase orders, or 0 if not found
 	"""
 	if not item_code:
-		frappe.logger("avg_rate").info("❌ No item_code provided.")
 		return 0
 
-	frappe.logger("avg_rate").info(f"🔍 Finding last 5 occurrences of Item: {item_code}")
+	# Called on every PO line edit in the UI; serve repeats from Redis
+	cached = frappe.cache().get_value(_avg_rate_cache_key(item_code))
+	if cached is not None:
+		return cached
 
-	# 1️⃣ Fetch ALL Purchase Order Items containing this item (sorted by creation DESC)
-	all_items = frappe.get_all(
-		"Purchase Order Item",
-		filters={"item_code": item_code, "docstatus": 1},
-		fields=["parent", "rate", "creation"],
-		order_by="creation desc",
+	# LIMIT in SQL: only the 5 newest rows leave the server instead of every
+	# Purchase Order Item row for this item being transferred and sliced here
+	rates = [
+		flt(rate)
+		for (rate,) in frappe.db.sql(
+			"""
+			SELECT rate
+			FROM `tabPurchase Order Item`
+			WHERE item_code = %s AND docstatus = 1
+			ORDER BY creation DESC
+			LIMIT 5
+		""",
+			(item_code,),
+		)
+	]
+
+	# Average over however many orders exist, capped at the latest 5
+	avg_rate = sum(rates) / len(rates) if rates else 0
+
+	# Logging in this path is synchronous disk I/O on every PO line edit;
+	# keep one summary line, and only when a developer is actually looking.
+	if frappe.conf.developer_mode:
+		frappe.logger("avg_rate").debug(
+			f"avg rate for {item_code} = {avg_rate} from {len(rates)} orders"
+		)
+
+	frappe.cache().set_value(
+		_avg_rate_cache_key(item_code), avg_rate, expires_in_sec=AVG_RATE_CACHE_TTL
 	)
 
-	frappe.logger("avg_rate").info(f"📄 Total occurrences found = {len(all_items)}")
+	return avg_rate
 
-	# 2️⃣ Take the last 5 occurrences if 5 or more exist, otherwise take all
-	if len(all_items) == 0:
-		frappe.logger("avg_rate").info("⚠️ No purchase orders found for this item")
-		return 0
 
-	# If 5 or more, take latest 5; otherwise take all
-	items_to_use = all_items[:5] if len(all_items) >= 5 else all_items
-	divisor = 5 if len(all_items) >= 5 else len(all_items)
+@frappe.whitelist()
+def get_last_5_avg_rate_bulk(item_codes):
+	"""
+	Calculate last-5 average rates for many items in one query.
+
+	Ranks each item's Purchase Order Item rows by creation with a window
+	function, so N items cost one round trip instead of N calls to
+	get_last_5_avg_rate.
 
-	rates = []
+	Args:
+	    item_codes: List of item codes (or JSON string of the list)
 
-	for idx, row in enumerate(items_to_use, start=1):
-		frappe.logger("avg_rate").info(
-			f"#{idx} → PO: {row.parent} | Rate: {row.rate} | Created: {row.creation}"
-		)
-		rates.append(float(row.rate or 0))
+	Returns:
+	    dict: {item_code: avg_rate}, 0 for items with no purchase orders
+	"""
+	if isinstance(item_codes, str):
+		item_codes = frappe.parse_json(item_codes)
+
+	item_codes = [code for code in (item_codes or []) if code]
+	if not item_codes:
+		return {}
 
-	# 3️⃣ Calculate average: divide by 5 if 5+ orders exist, otherwise by actual count
-	avg_rate = sum(rates) / divisor
+	rows = frappe.db.sql(
+		"""
+		WITH ranked AS (
+			SELECT
+				item_code,
+				rate,
+				ROW_NUMBER() OVER (
+					PARTITION BY item_code ORDER BY creation DESC
+				) AS rn
+			FROM `tabPurchase Order Item`
+			WHERE item_code IN %(item_codes)s AND docstatus = 1
+		)
+		SELECT item_code, AVG(rate)
+		FROM ranked
+		WHERE rn <= 5
+		GROUP BY item_code
+	""",
+		{"item_codes": tuple(item_codes)},
+	)
 
-	frappe.logger("avg_rate").info(f"🧮 Rates used for avg: {rates}")
-	frappe.logger("avg_rate").info(f"📊 Number of purchase orders used: {len(rates)}, Divisor: {divisor}")
-	frappe.logger("avg_rate").info(f"✅ Final Average Rate = {avg_rate}")
+	result = {code: 0 for code in item_codes}
+	for item_code, avg_rate in rows:
+		result[item_code] = flt(avg_rate)
 
-	return avg_rate
+	return result
@@ -1,8 +1,184 @@
 """API endpoints for Sales Summary Dashboard."""
 
+import hashlib
+import time
+
 import frappe
 from frappe import _
-from frappe.utils import flt, getdate
+from frappe.utils import cint, flt, getdate
+
+# Redis hash of overview payloads keyed by filter hash. Dashboards poll
+# with the same filters, so even a short TTL absorbs most loads; the hash
+# is dropped whenever a Sales Order or Sales Invoice is submitted or
+# cancelled.
+OVERVIEW_CACHE_KEY = "sales_overview"
+OVERVIEW_CACHE_TTL = 60
+
+# The tab payloads (metrics + one page of rows) are cached the same way
+# under their own hash, keyed by the full argument tuple including the
+# page cursor; concurrent users opening the default "today" view all hit
+# the same entry.
+TAB_CACHE_KEY = "sales_dashboard_tabs"
+TAB_CACHE_TTL = 60
+
+# Query skeletons built once at import; per call only the filter clauses
+# are spliced in and the values bound, so the hot path does one .format
+# per statement instead of re-assembling multi-line literals.
+_OVERVIEW_SQL = """
+    SELECT
+        COALESCE(SUM(CASE
+            WHEN ref_doctype = 'Sales Order' THEN doc_count ELSE 0
+        END), 0) as total_orders,
+        COALESCE(SUM(CASE
+            WHEN ref_doctype = 'Sales Invoice' THEN doc_count ELSE 0
+        END), 0) as total_invoices,
+        ROUND(COALESCE(SUM(CASE
+            WHEN ref_doctype = 'Sales Order' THEN grand_total_sum ELSE 0
+        END), 0), 2) as total_order_value,
+        ROUND(COALESCE(SUM(CASE
+            WHEN ref_doctype = 'Sales Invoice' THEN grand_total_sum ELSE 0
+        END), 0), 2) as total_invoice_value
+    FROM `tabSales Dashboard Daily Rollup`
+    WHERE 1 = 1
+        {date_filter}
+        {customer_filter}
+"""
+
+_SO_METRICS_SQL = """
+    SELECT
+        COUNT(*) as total_so_count,
+        COALESCE(SUM(CASE
+            WHEN docstatus = 1 AND status = 'To Deliver and Bill'
+            THEN 1 ELSE 0
+        END), 0) as to_deliver_and_bill_count,
+        COALESCE(SUM(CASE
+            WHEN docstatus = 1 AND status = 'Partially Delivered'
+            THEN 1 ELSE 0
+        END), 0) as partly_delivered_count,
+        ROUND(COALESCE(SUM(CASE
+            WHEN 1 = 1 {status_filter}
+            THEN grand_total ELSE 0
+        END), 0), 2) as total_value
+    FROM `tabSales Order`
+    WHERE docstatus != 2
+        {date_filter}
+        {customer_filter}
+        {id_filter}
+        {item_filter}
+"""
+
+_SO_LIST_SQL = """
+    SELECT
+        name,
+        transaction_date,
+        creation,
+        delivery_date,
+        status,
+        customer,
+        grand_total,
+        COUNT(*) OVER () as total_rows
+    FROM `tabSales Order`
+    WHERE docstatus != 2
+        {date_filter}
+        {customer_filter}
+        {status_filter}
+        {id_filter}
+        {item_filter}
+        {cursor_filter}
+    ORDER BY transaction_date DESC, creation DESC, name DESC
+    LIMIT %(page_size)s
+"""
+
+_SI_METRICS_SQL = """
+    SELECT
+        COUNT(*) as total_invoice_count,
+        COALESCE(SUM(CASE
+            WHEN docstatus = 1 AND status = 'Paid'
+            THEN 1 ELSE 0
+        END), 0) as paid_count,
+        COALESCE(SUM(CASE
+            WHEN docstatus = 1 AND status = 'Unpaid'
+            THEN 1 ELSE 0
+        END), 0) as unpaid_count,
+        COALESCE(SUM(CASE
+            WHEN docstatus = 1 AND status = 'Overdue'
+            THEN 1 ELSE 0
+        END), 0) as overdue_count,
+        ROUND(COALESCE(SUM(CASE
+            WHEN 1 = 1 {status_filter}
+            THEN grand_total ELSE 0
+        END), 0), 2) as total_value
+    FROM `tabSales Invoice`
+    WHERE docstatus != 2
+        {date_filter}
+        {customer_filter}
+        {id_filter}
+        {item_filter}
+"""
+
+_SI_LIST_SQL = """
+    SELECT
+        name,
+        posting_date,
+        creation,
+        due_date,
+        status,
+        customer,
+        grand_total,
+        COUNT(*) OVER () as total_rows
+    FROM `tabSales Invoice`
+    WHERE docstatus != 2
+        {date_filter}
+        {customer_filter}
+        {status_filter}
+        {id_filter}
+        {item_filter}
+        {cursor_filter}
+    ORDER BY posting_date DESC, creation DESC, name DESC
+    LIMIT %(page_size)s
+"""
+
+# Filter dropdown options are near-static reference data; cache them in
+# Redis and drop the key when a Customer or Item changes.
+FILTER_OPTIONS_CACHE_KEY = "sales_dashboard_filter_options"
+FILTER_OPTIONS_CACHE_TTL = 3600
+
+
+def _is_impossible_range(from_date, to_date):
+    """True when the date range can never match a row — skip the DB entirely."""
+    return bool(from_date and to_date and getdate(from_date) > getdate(to_date))
+
+
+def clear_overview_cache(doc=None, method=None):
+    """DocEvent hook (Sales Order/Sales Invoice on_submit/on_cancel).
+
+    Drops the cached overview and tab payloads so a fresh submission is
+    visible on the next dashboard poll.
+    """
+    frappe.cache().delete_key(OVERVIEW_CACHE_KEY)
+    frappe.cache().delete_key(TAB_CACHE_KEY)
+
+
+def _tab_cache_get(cache_key):
+    """Return a cached tab payload if it is still within its TTL."""
+    cached = frappe.cache().hget(TAB_CACHE_KEY, cache_key)
+    if cached and time.time() - cached.get("cached_at", 0) < TAB_CACHE_TTL:
+        return cached.get("data")
+    return None
+
+
+def _tab_cache_set(cache_key, data):
+    """Store a tab payload alongside its write timestamp."""
+    frappe.cache().hset(TAB_CACHE_KEY, cache_key, {"cached_at": time.time(), "data": data})
+
+
+def clear_filter_options_cache(doc=None, method=None):
+    """DocEvent hook (Customer/Item on_update/on_trash).
+
+    Drops the cached dropdown options so renames, new records and
+    deletions show up on the next dashboard open.
+    """
+    frappe.cache().delete_value(FILTER_OPTIONS_CACHE_KEY)
 
 
 @frappe.whitelist()
@@ -24,46 +200,45 @@ def get_overview_data(from_date=None, to_date=None, customer=None):
         }
     """
     try:
-        # Build date filter for Sales Order
-        so_date_filter = get_date_filter_sql(from_date, to_date, "transaction_date")
-        si_date_filter = get_date_filter_sql(from_date, to_date, "posting_date")
-        customer_filter = get_customer_filter_sql(customer)
-        
-        # Get Sales Order metrics (only submitted)
-        so_data = frappe.db.sql("""
-            SELECT 
-                COUNT(*) as total_orders,
-                COALESCE(SUM(grand_total), 0) as total_value
-            FROM `tabSales Order`
-            WHERE docstatus = 1
-                {date_filter}
-                {customer_filter}
-        """.format(
-            date_filter=so_date_filter,
-            customer_filter=customer_filter
-        ), as_dict=True)
-        
-        # Get Sales Invoice metrics (only submitted)
-        si_data = frappe.db.sql("""
-            SELECT 
-                COUNT(*) as total_invoices,
-                COALESCE(SUM(grand_total), 0) as total_value
-            FROM `tabSales Invoice`
-            WHERE docstatus = 1
-                {date_filter}
-                {customer_filter}
-        """.format(
-            date_filter=si_date_filter,
+        if _is_impossible_range(from_date, to_date):
+            return {
+                "total_sales_orders": 0,
+                "total_sales_invoices": 0,
+                "total_order_value": 0,
+                "total_invoice_value": 0
+            }
+
+        cache_key = hashlib.md5(
+            f"{from_date}|{to_date}|{customer}".encode()
+        ).hexdigest()
+        cached = frappe.cache().hget(OVERVIEW_CACHE_KEY, cache_key)
+        if cached and time.time() - cached.get("cached_at", 0) < OVERVIEW_CACHE_TTL:
+            return cached.get("data")
+
+        date_filter, date_params = get_date_filter_sql(from_date, to_date, "doc_date")
+        customer_filter, customer_params = get_customer_filter_sql(customer)
+        params = {**date_params, **customer_params}
+
+        # Submitted documents are pre-summed per (date, customer, doctype)
+        # into the rollup by submit/cancel hooks, so the overview sums a
+        # handful of rollup rows instead of scanning both transaction tables
+        data = frappe.db.sql(_OVERVIEW_SQL.format(
+            date_filter=date_filter,
             customer_filter=customer_filter
-        ), as_dict=True)
-        
-        return {
-            "total_sales_orders": so_data[0].get("total_orders", 0) if so_data else 0,
-            "total_sales_invoices": si_data[0].get("total_invoices", 0) if si_data else 0,
-            "total_order_value": flt(so_data[0].get("total_value", 0), 2) if so_data else 0,
-            "total_invoice_value": flt(si_data[0].get("total_value", 0), 2) if si_data else 0
+        ), params or None, as_dict=True)
+
+        row = data[0] if data else {}
+        result = {
+            "total_sales_orders": row.get("total_orders", 0) or 0,
+            "total_sales_invoices": row.get("total_invoices", 0) or 0,
+            "total_order_value": row.get("total_order_value", 0) or 0,
+            "total_invoice_value": row.get("total_invoice_value", 0) or 0
         }
-        
+        frappe.cache().hset(
+            OVERVIEW_CACHE_KEY, cache_key, {"cached_at": time.time(), "data": result}
+        )
+        return result
+
     except Exception:
         frappe.log_error(
             message=frappe.get_traceback(),
@@ -78,10 +253,10 @@ def get_overview_data(from_date=None, to_date=None, customer=None):
 
 
 @frappe.whitelist()
-def get_sales_order_data(from_date=None, to_date=None, customer=None, status=None, order_id=None, item=None):
+def get_sales_order_data(from_date=None, to_date=None, customer=None, status=None, order_id=None, item=None, page_cursor=None, page_size=100):
     """
     Get Sales Order tab data.
-    
+
     Args:
         from_date: Start date filter
         to_date: End date filter
@@ -89,7 +264,11 @@ def get_sales_order_data(from_date=None, to_date=None, customer=None, status=Non
         status: Status filter
         order_id: Sales Order ID filter
         item: Item Code filter
-        
+        page_cursor: [transaction_date, creation, name] of the last row of
+            the previous page; the next page resumes strictly after it via
+            an index seek instead of an OFFSET re-scan
+        page_size: Rows per page
+
     Returns:
         dict: {
             metrics: {
@@ -102,106 +281,111 @@ def get_sales_order_data(from_date=None, to_date=None, customer=None, status=Non
         }
     """
     try:
-        date_filter = get_date_filter_sql(from_date, to_date, "transaction_date")
-        customer_filter = get_customer_filter_sql(customer)
-        status_filter = get_so_status_filter_sql(status)
-        id_filter = get_id_filter_sql(order_id, "name")
-        item_filter = get_item_filter_sql(item, "Sales Order")
-        
-        # Total SO count (non-cancelled only)
-        total_so_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Order`
-            WHERE docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # To Deliver and Bill orders
-        to_deliver_bill_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Order`
-            WHERE docstatus = 1
-                AND status = 'To Deliver and Bill'
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Partly Delivered orders
-        partly_delivered_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Order`
-            WHERE docstatus = 1
-                AND status = 'Partially Delivered'
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Total value for non-cancelled orders
-        total_value_data = frappe.db.sql("""
-            SELECT COALESCE(SUM(grand_total), 0) as total_value
-            FROM `tabSales Order`
-            WHERE docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {status_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
+        if _is_impossible_range(from_date, to_date):
+            return {
+                "metrics": {
+                    "total_so_count": 0,
+                    "to_deliver_and_bill_count": 0,
+                    "partly_delivered_count": 0,
+                    "total_value": 0
+                },
+                "orders": []
+            }
+
+        cache_key = hashlib.md5(
+            f"so|{from_date}|{to_date}|{customer}|{status}|{order_id}|{item}|{page_cursor}|{page_size}".encode()
+        ).hexdigest()
+        cached = _tab_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        date_filter, date_params = get_date_filter_sql(from_date, to_date, "transaction_date")
+        customer_filter, customer_params = get_customer_filter_sql(customer)
+        status_filter, status_params = get_so_status_filter_sql(status)
+        id_filter, id_params = get_id_filter_sql(order_id, "name")
+        item_filter, item_params = get_item_filter_sql(item, "Sales Order")
+        params = {
+            **date_params,
+            **customer_params,
+            **status_params,
+            **id_params,
+            **item_params,
+        }
+
+        if isinstance(page_cursor, str):
+            page_cursor = frappe.parse_json(page_cursor)
+
+        cursor_filter = ""
+        if page_cursor and len(page_cursor) == 3:
+            cursor_filter = (
+                " AND (transaction_date, creation, name)"
+                " < (%(cursor_date)s, %(cursor_creation)s, %(cursor_name)s)"
+            )
+            params["cursor_date"] = page_cursor[0]
+            params["cursor_creation"] = page_cursor[1]
+            params["cursor_name"] = page_cursor[2]
+        params["page_size"] = cint(page_size) or 100
+
+        # One conditional-aggregation pass over the non-cancelled rows
+        # replaces the four separate count/sum queries that shared the same
+        # filters; the status filter only scopes total_value, so it moves
+        # inside that CASE instead of the WHERE
+        metrics_data = frappe.db.sql(_SO_METRICS_SQL.format(
             date_filter=date_filter,
             customer_filter=customer_filter,
             status_filter=status_filter,
             id_filter=id_filter,
             item_filter=item_filter
-        ), as_dict=True)
-        
+        ), params or None, as_dict=True)
+        metrics_row = metrics_data[0] if metrics_data else {}
+
         # Get orders list for table with additional fields
-        orders = frappe.db.sql("""
-            SELECT 
-                so.name,
-                so.transaction_date,
-                so.delivery_date,
-                so.status,
-                so.customer,
-                so.grand_total
-            FROM `tabSales Order` so
-            WHERE so.docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {status_filter}
-                {id_filter}
-                {item_filter}
-            ORDER BY so.transaction_date DESC, so.creation DESC
-            LIMIT 100
-        """.format(
+        orders = frappe.db.sql(_SO_LIST_SQL.format(
             date_filter=date_filter,
             customer_filter=customer_filter,
             status_filter=status_filter,
             id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
+            item_filter=item_filter,
+            cursor_filter=cursor_filter
+        ), params, as_dict=True)
+
+        # The window count rides the same scan as the page itself — no
+        # separate COUNT(*) probe; peel it off the row dicts
+        list_total = 0
+        for order in orders:
+            list_total = order.pop("total_rows", 0)
+
+        next_cursor = None
+        if len(orders) == params["page_size"]:
+            last = orders[-1]
+            next_cursor = [str(last.transaction_date), str(last.creation), last.name]
+
+        # Batch the follow-up lookups: one grouped child-table query and one
+        # Customer fetch for the whole page instead of a query per order
+        qty_map = {}
+        customer_name_map = {}
+        if orders:
+            order_names = tuple(order.name for order in orders)
+            for row in frappe.db.sql("""
+                SELECT
+                    parent,
+                    COALESCE(SUM(qty), 0) as ordered_qty,
+                    COALESCE(SUM(delivered_qty), 0) as delivered_qty
+                FROM `tabSales Order Item`
+                WHERE parent IN %(names)s
+                GROUP BY parent
+            """, {"names": order_names}, as_dict=True):
+                qty_map[row.parent] = row
+
+            customer_ids = {order.customer for order in orders if order.customer}
+            if customer_ids:
+                for row in frappe.db.sql("""
+                    SELECT name, customer_name
+                    FROM `tabCustomer`
+                    WHERE name IN %(names)s
+                """, {"names": tuple(customer_ids)}, as_dict=True):
+                    customer_name_map[row.name] = row.customer_name
+
         # Enrich orders with lead time, ordered qty, and delivered qty
         for order in orders:
             # Calculate lead time (days between delivery_date and transaction_date)
@@ -211,32 +395,25 @@ def get_sales_order_data(from_date=None, to_date=None, customer=None, status=Non
                 order["lead_time"] = (delivery - transaction).days
             else:
                 order["lead_time"] = None
-            
-            # Get ordered and delivered quantities from Sales Order Item
-            item_data = frappe.db.sql("""
-                SELECT 
-                    COALESCE(SUM(qty), 0) as ordered_qty,
-                    COALESCE(SUM(delivered_qty), 0) as delivered_qty
-                FROM `tabSales Order Item`
-                WHERE parent = %s
-            """, (order.name,), as_dict=True)
-            
-            if item_data and item_data[0]:
-                order["ordered_qty"] = flt(item_data[0].get("ordered_qty", 0), 2)
-                order["delivered_qty"] = flt(item_data[0].get("delivered_qty", 0), 2)
-            else:
-                order["ordered_qty"] = 0
-                order["delivered_qty"] = 0
-        
-        return {
+
+            item_data = qty_map.get(order.name)
+            order["ordered_qty"] = flt(item_data.get("ordered_qty", 0), 2) if item_data else 0
+            order["delivered_qty"] = flt(item_data.get("delivered_qty", 0), 2) if item_data else 0
+            order["customer_name"] = customer_name_map.get(order.customer) or order.customer
+
+        result = {
             "metrics": {
-                "total_so_count": total_so_data[0].get("count", 0) if total_so_data else 0,
-                "to_deliver_and_bill_count": to_deliver_bill_data[0].get("count", 0) if to_deliver_bill_data else 0,
-                "partly_delivered_count": partly_delivered_data[0].get("count", 0) if partly_delivered_data else 0,
-                "total_value": flt(total_value_data[0].get("total_value", 0), 2) if total_value_data else 0
+                "total_so_count": metrics_row.get("total_so_count", 0) or 0,
+                "to_deliver_and_bill_count": metrics_row.get("to_deliver_and_bill_count", 0) or 0,
+                "partly_delivered_count": metrics_row.get("partly_delivered_count", 0) or 0,
+                "total_value": metrics_row.get("total_value", 0) or 0
             },
-            "orders": orders
+            "orders": orders,
+            "next_cursor": next_cursor,
+            "list_total": list_total
         }
+        _tab_cache_set(cache_key, result)
+        return result
         
     except Exception:
         frappe.log_error(
@@ -255,10 +432,10 @@ def get_sales_order_data(from_date=None, to_date=None, customer=None, status=Non
 
 
 @frappe.whitelist()
-def get_sales_invoice_data(from_date=None, to_date=None, customer=None, status=None, invoice_id=None, item=None):
+def get_sales_invoice_data(from_date=None, to_date=None, customer=None, status=None, invoice_id=None, item=None, page_cursor=None, page_size=100):
     """
     Get Sales Invoice tab data.
-    
+
     Args:
         from_date: Start date filter
         to_date: End date filter
@@ -266,7 +443,11 @@ def get_sales_invoice_data(from_date=None, to_date=None, customer=None, status=N
         status: Status filter
         invoice_id: Sales Invoice ID filter
         item: Item Code filter
-        
+        page_cursor: [posting_date, creation, name] of the last row of the
+            previous page; the next page resumes strictly after it via an
+            index seek instead of an OFFSET re-scan
+        page_size: Rows per page
+
     Returns:
         dict: {
             metrics: {
@@ -280,149 +461,101 @@ def get_sales_invoice_data(from_date=None, to_date=None, customer=None, status=N
         }
     """
     try:
-        date_filter = get_date_filter_sql(from_date, to_date, "posting_date")
-        customer_filter = get_customer_filter_sql(customer)
-        status_filter = get_status_filter_sql(status)
-        id_filter = get_id_filter_sql(invoice_id, "name")
-        item_filter = get_item_filter_sql(item, "Sales Invoice")
-        
-        # Unpaid invoices count
-        unpaid_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Invoice`
-            WHERE docstatus = 1
-                AND status = 'Unpaid'
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Draft invoices count
-        draft_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Invoice`
-            WHERE docstatus = 0
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Overdue invoices count
-        overdue_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Invoice`
-            WHERE docstatus = 1
-                AND status = 'Overdue'
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Paid invoices count
-        paid_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Invoice`
-            WHERE docstatus = 1
-                AND status = 'Paid'
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
+        if _is_impossible_range(from_date, to_date):
+            return {
+                "metrics": {
+                    "total_invoice_count": 0,
+                    "paid_count": 0,
+                    "unpaid_count": 0,
+                    "overdue_count": 0,
+                    "total_value": 0
+                },
+                "invoices": []
+            }
+
+        cache_key = hashlib.md5(
+            f"si|{from_date}|{to_date}|{customer}|{status}|{invoice_id}|{item}|{page_cursor}|{page_size}".encode()
+        ).hexdigest()
+        cached = _tab_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        date_filter, date_params = get_date_filter_sql(from_date, to_date, "posting_date")
+        customer_filter, customer_params = get_customer_filter_sql(customer)
+        status_filter, status_params = get_status_filter_sql(status)
+        id_filter, id_params = get_id_filter_sql(invoice_id, "name")
+        item_filter, item_params = get_item_filter_sql(item, "Sales Invoice")
+        params = {
+            **date_params,
+            **customer_params,
+            **status_params,
+            **id_params,
+            **item_params,
+        }
+
+        if isinstance(page_cursor, str):
+            page_cursor = frappe.parse_json(page_cursor)
+
+        cursor_filter = ""
+        if page_cursor and len(page_cursor) == 3:
+            cursor_filter = (
+                " AND (posting_date, creation, name)"
+                " < (%(cursor_date)s, %(cursor_creation)s, %(cursor_name)s)"
+            )
+            params["cursor_date"] = page_cursor[0]
+            params["cursor_creation"] = page_cursor[1]
+            params["cursor_name"] = page_cursor[2]
+        params["page_size"] = cint(page_size) or 100
         
-        # Total value for filtered invoices (non-cancelled)
-        total_value_data = frappe.db.sql("""
-            SELECT COALESCE(SUM(grand_total), 0) as total_value
-            FROM `tabSales Invoice`
-            WHERE docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {status_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
+        # One conditional-aggregation pass over the non-cancelled rows
+        # replaces the five separate count/sum queries that shared the same
+        # filters; the status filter only scopes total_value, so it moves
+        # inside that CASE instead of the WHERE. The old per-status draft
+        # count was computed but never returned, so it is gone entirely.
+        metrics_data = frappe.db.sql(_SI_METRICS_SQL.format(
             date_filter=date_filter,
             customer_filter=customer_filter,
             status_filter=status_filter,
             id_filter=id_filter,
             item_filter=item_filter
-        ), as_dict=True)
-        
+        ), params or None, as_dict=True)
+        metrics_row = metrics_data[0] if metrics_data else {}
+
         # Get invoices list for table (non-cancelled)
-        invoices = frappe.db.sql("""
-            SELECT 
-                name,
-                posting_date,
-                due_date,
-                status,
-                customer,
-                grand_total
-            FROM `tabSales Invoice`
-            WHERE docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {status_filter}
-                {id_filter}
-                {item_filter}
-            ORDER BY posting_date DESC, creation DESC
-            LIMIT 100
-        """.format(
+        invoices = frappe.db.sql(_SI_LIST_SQL.format(
             date_filter=date_filter,
             customer_filter=customer_filter,
             status_filter=status_filter,
             id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        # Get total invoice count (non-cancelled)
-        total_invoice_data = frappe.db.sql("""
-            SELECT COUNT(*) as count
-            FROM `tabSales Invoice`
-            WHERE docstatus != 2
-                {date_filter}
-                {customer_filter}
-                {id_filter}
-                {item_filter}
-        """.format(
-            date_filter=date_filter,
-            customer_filter=customer_filter,
-            id_filter=id_filter,
-            item_filter=item_filter
-        ), as_dict=True)
-        
-        return {
+            item_filter=item_filter,
+            cursor_filter=cursor_filter
+        ), params, as_dict=True)
+
+        # The window count rides the same scan as the page itself — no
+        # separate COUNT(*) probe; peel it off the row dicts
+        list_total = 0
+        for invoice in invoices:
+            list_total = invoice.pop("total_rows", 0)
+
+        next_cursor = None
+        if len(invoices) == params["page_size"]:
+            last = invoices[-1]
+            next_cursor = [str(last.posting_date), str(last.creation), last.name]
+
+        result = {
             "metrics": {
-                "total_invoice_count": total_invoice_data[0].get("count", 0) if total_invoice_data else 0,
-                "paid_count": paid_data[0].get("count", 0) if paid_data else 0,
-                "unpaid_count": unpaid_data[0].get("count", 0) if unpaid_data else 0,
-                "overdue_count": overdue_data[0].get("count", 0) if overdue_data else 0,
-                "total_value": flt(total_value_data[0].get("total_value", 0), 2) if total_value_data else 0
+                "total_invoice_count": metrics_row.get("total_invoice_count", 0) or 0,
+                "paid_count": metrics_row.get("paid_count", 0) or 0,
+                "unpaid_count": metrics_row.get("unpaid_count", 0) or 0,
+                "overdue_count": metrics_row.get("overdue_count", 0) or 0,
+                "total_value": metrics_row.get("total_value", 0) or 0
             },
-            "invoices": invoices
+            "invoices": invoices,
+            "next_cursor": next_cursor,
+            "list_total": list_total
         }
+        _tab_cache_set(cache_key, result)
+        return result
         
     except Exception:
         frappe.log_error(
@@ -441,6 +574,30 @@ def get_sales_invoice_data(from_date=None, to_date=None, customer=None, status=N
         }
 
 
+@frappe.whitelist()
+def get_dashboard_bundle(from_date=None, to_date=None, customer=None, so_status=None, order_id=None, so_item=None, si_status=None, invoice_id=None, si_item=None):
+    """
+    Get all dashboard payloads in one request.
+
+    Opening the dashboard fired four whitelisted calls, each paying
+    Frappe's session/permission setup. One bundle call amortizes that
+    overhead; the sub-endpoints keep their own caches and error
+    handling, so a failure in one tab still returns zeros for just that
+    section. Status/ID/item filters are per tab because the page keeps
+    separate inputs for the Sales Order and Sales Invoice tabs.
+    """
+    return {
+        "overview": get_overview_data(from_date, to_date, customer),
+        "sales_orders": get_sales_order_data(
+            from_date, to_date, customer, so_status, order_id, so_item
+        ),
+        "sales_invoices": get_sales_invoice_data(
+            from_date, to_date, customer, si_status, invoice_id, si_item
+        ),
+        "filters": get_filter_options(),
+    }
+
+
 @frappe.whitelist()
 def get_filter_options():
     """
@@ -455,61 +612,80 @@ def get_filter_options():
         }
     """
     try:
-        # Get unique customers from Sales Order and Sales Invoice
-        customers = frappe.db.sql("""
-            SELECT DISTINCT customer_name as name
-            FROM `tabCustomer`
-            WHERE disabled = 0
-            ORDER BY customer_name
-            LIMIT 200
-        """, as_dict=True)
-        
-        # Get unique items from actual Sales Orders and Sales Invoices (more relevant)
-        items = frappe.db.sql("""
-            SELECT DISTINCT item_code
-            FROM (
-                SELECT DISTINCT item_code
-                FROM `tabSales Order Item`
-                WHERE parent IN (
-                    SELECT name FROM `tabSales Order` WHERE docstatus != 2
-                )
-                UNION
-                SELECT DISTINCT item_code
-                FROM `tabSales Invoice Item`
-                WHERE parent IN (
-                    SELECT name FROM `tabSales Invoice` WHERE docstatus != 2
-                )
-            ) AS combined_items
-            WHERE item_code IS NOT NULL
-            ORDER BY item_code
-            LIMIT 200
-        """, as_dict=True)
-        
-        # Get Sales Order IDs (non-cancelled)
-        sales_order_ids = frappe.db.sql("""
-            SELECT DISTINCT name
-            FROM `tabSales Order`
-            WHERE docstatus != 2
-            ORDER BY name DESC
-            LIMIT 200
-        """, as_dict=True)
-        
-        # Get Sales Invoice IDs (non-cancelled)
-        sales_invoice_ids = frappe.db.sql("""
-            SELECT DISTINCT name
-            FROM `tabSales Invoice`
-            WHERE docstatus != 2
-            ORDER BY name DESC
-            LIMIT 200
+        cached = frappe.cache().get_value(FILTER_OPTIONS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        # One kind-tagged UNION ALL replaces four round-trips; each branch
+        # keeps its own ordering and LIMIT inside a derived table, and the
+        # rows are bucketed by kind in Python
+        rows = frappe.db.sql("""
+            SELECT 'customer' AS kind, val FROM (
+                SELECT DISTINCT customer_name AS val
+                FROM `tabCustomer`
+                WHERE disabled = 0
+                ORDER BY customer_name
+                LIMIT 200
+            ) c
+            UNION ALL
+            SELECT 'item', val FROM (
+                SELECT DISTINCT item_code AS val
+                FROM (
+                    SELECT DISTINCT item_code
+                    FROM `tabSales Order Item`
+                    WHERE parent IN (
+                        SELECT name FROM `tabSales Order` WHERE docstatus != 2
+                    )
+                    UNION
+                    SELECT DISTINCT item_code
+                    FROM `tabSales Invoice Item`
+                    WHERE parent IN (
+                        SELECT name FROM `tabSales Invoice` WHERE docstatus != 2
+                    )
+                ) AS combined_items
+                WHERE item_code IS NOT NULL
+                ORDER BY item_code
+                LIMIT 200
+            ) i
+            UNION ALL
+            SELECT 'sales_order', val FROM (
+                SELECT name AS val
+                FROM `tabSales Order`
+                WHERE docstatus != 2
+                ORDER BY name DESC
+                LIMIT 200
+            ) so
+            UNION ALL
+            SELECT 'sales_invoice', val FROM (
+                SELECT name AS val
+                FROM `tabSales Invoice`
+                WHERE docstatus != 2
+                ORDER BY name DESC
+                LIMIT 200
+            ) si
         """, as_dict=True)
-        
-        return {
-            "customers": [c.get("name") for c in customers if c.get("name")],
-            "items": [i.get("item_code") for i in items if i.get("item_code")],
-            "sales_order_ids": [so.get("name") for so in sales_order_ids if so.get("name")],
-            "sales_invoice_ids": [si.get("name") for si in sales_invoice_ids if si.get("name")]
+
+        buckets = {
+            "customer": [],
+            "item": [],
+            "sales_order": [],
+            "sales_invoice": [],
         }
-        
+        for row in rows:
+            if row.val:
+                buckets[row.kind].append(row.val)
+
+        options = {
+            "customers": buckets["customer"],
+            "items": buckets["item"],
+            "sales_order_ids": buckets["sales_order"],
+            "sales_invoice_ids": buckets["sales_invoice"]
+        }
+        frappe.cache().set_value(
+            FILTER_OPTIONS_CACHE_KEY, options, expires_in_sec=FILTER_OPTIONS_CACHE_TTL
+        )
+        return options
+
     except Exception:
         frappe.log_error(
             message=frappe.get_traceback(),
@@ -519,86 +695,108 @@ def get_filter_options():
 
 
 def get_date_filter_sql(from_date, to_date, date_field):
-    """Generate SQL date filter clause."""
-    filters = []
-    
+    """Generate SQL date filter clause with bind parameters.
+
+    Returns:
+        tuple: (clause, params) — values bind via frappe.db.sql so the
+        server sees one parameterized statement per filter shape instead
+        of a new literal per call.
+    """
+    clause = ""
+    params = {}
+
     if from_date:
-        from_date_safe = frappe.db.escape(str(getdate(from_date)))
-        filters.append(f" AND {date_field} >= {from_date_safe}")
-    
+        clause += f" AND {date_field} >= %(from_date)s"
+        params["from_date"] = str(getdate(from_date))
+
     if to_date:
-        to_date_safe = frappe.db.escape(str(getdate(to_date)))
-        filters.append(f" AND {date_field} <= {to_date_safe}")
-    
-    return "".join(filters)
+        clause += f" AND {date_field} <= %(to_date)s"
+        params["to_date"] = str(getdate(to_date))
+
+    return clause, params
 
 
 def get_customer_filter_sql(customer):
-    """Generate SQL customer filter clause."""
+    """Generate SQL customer filter clause with bind parameters."""
     if not customer:
-        return ""
-    
-    customer_safe = frappe.db.escape(customer)
-    return f" AND customer = {customer_safe}"
+        return "", {}
+
+    return " AND customer = %(customer)s", {"customer": customer}
 
 
 def get_status_filter_sql(status):
-    """Generate SQL status filter clause."""
+    """Generate SQL status filter clause with bind parameters."""
     if not status:
-        return ""
-    
+        return "", {}
+
     # Handle Draft status specially (docstatus = 0)
     if status == "Draft":
-        return " AND docstatus = 0"
-    
-    status_safe = frappe.db.escape(status)
-    return f" AND status = {status_safe}"
+        return " AND docstatus = 0", {}
+
+    return " AND status = %(status)s", {"status": status}
 
 
 def get_so_status_filter_sql(status):
     """Generate SQL status filter clause for Sales Order tab."""
     if not status or status == "All":
-        return ""
-    
+        return "", {}
+
     # Handle Pending status - includes "To Deliver and Bill", "To Deliver", "To Bill"
     if status == "Pending":
-        return """ AND (
-            status = 'To Deliver and Bill' 
-            OR status = 'To Deliver' 
-            OR status = 'To Bill'
-        )"""
-    
+        return (
+            " AND status IN %(so_statuses)s",
+            {"so_statuses": ("To Deliver and Bill", "To Deliver", "To Bill")},
+        )
+
     # Handle Partially status - includes "Partially Delivered", "Partially Delivered and Billed"
     if status == "Partially":
-        return """ AND (
-            status = 'Partially Delivered' 
-            OR status = 'Partially Delivered and Billed'
-        )"""
-    
-    status_safe = frappe.db.escape(status)
-    return f" AND status = {status_safe}"
+        return (
+            " AND status IN %(so_statuses)s",
+            {"so_statuses": ("Partially Delivered", "Partially Delivered and Billed")},
+        )
+
+    return " AND status = %(status)s", {"status": status}
 
 
 def get_id_filter_sql(doc_id, field_name):
-    """Generate SQL ID filter clause."""
+    """Generate SQL ID filter clause with bind parameters.
+
+    Document names are prefix-structured (e.g. SAL-ORD-2025-), so a
+    prefix LIKE seeks the primary-key B-tree instead of the full scan a
+    leading wildcard forces.
+    """
     if not doc_id:
-        return ""
-    
-    doc_id_safe = frappe.db.escape(f"%{doc_id}%")
-    return f" AND {field_name} LIKE {doc_id_safe}"
+        return "", {}
+
+    return f" AND {field_name} LIKE %(doc_id)s", {"doc_id": f"{doc_id}%"}
 
 
 def get_item_filter_sql(item, doctype):
-    """Generate SQL item filter clause using subquery."""
+    """Generate SQL item filter clause using an EXISTS probe.
+
+    Exact values (the dropdown sends full item codes) probe the child
+    table's item_code index with equality; only values carrying explicit
+    SQL wildcards fall back to LIKE.
+    """
     if not item or not item.strip():
-        return ""
-    
+        return "", {}
+
     child_table = f"tab{doctype} Item"
     item_clean = item.strip()
-    item_safe = frappe.db.escape(f"%{item_clean}%")
-    
-    return f""" AND name IN (
-        SELECT DISTINCT parent 
-        FROM `{child_table}` 
-        WHERE item_code LIKE {item_safe}
-    )"""
+
+    if "%" in item_clean or "_" in item_clean:
+        item_predicate = "ci.item_code LIKE %(item)s"
+        params = {"item": item_clean}
+    else:
+        item_predicate = "ci.item_code = %(item)s"
+        params = {"item": item_clean}
+
+    return (
+        f""" AND EXISTS (
+        SELECT 1
+        FROM `{child_table}` ci
+        WHERE ci.parent = `tab{doctype}`.name
+            AND {item_predicate}
+    )""",
+        params,
+    )
@@ -2,7 +2,11 @@
 
 import frappe
 from frappe import _
-from hexplastics.utils.stock_utils import get_all_items_stock_quantity, get_item_stock_quantity
+from hexplastics.utils.stock_utils import (
+	get_all_items_stock_quantity,
+	get_item_stock_quantity,
+	get_stock_summary_sql,
+)
 from hexplastics.tasks import check_stock_levels_and_send_alert
 
 
@@ -71,22 +75,18 @@ def get_stock_summary(warehouse=None, item_group=None):
 		dict: Summary statistics of stock
 	"""
 	try:
-		stock_data = get_all_items_stock_quantity(
-			warehouse=warehouse, item_group=item_group, include_zero_stock=False
-		)
+		# Aggregate in SQL (one row per item group) instead of materializing
+		# a dict per item and summing in Python
+		group_rows = get_stock_summary_sql(warehouse=warehouse, item_group=item_group)
 
-		total_items = len(stock_data)
-		total_qty = sum(item.get("actual_qty", 0) for item in stock_data)
-		items_with_stock = len([item for item in stock_data if item.get("actual_qty", 0) > 0])
-
-		# Group by item group
-		by_item_group = {}
-		for item in stock_data:
-			group = item.get("item_group", "Unknown")
-			if group not in by_item_group:
-				by_item_group[group] = {"count": 0, "total_qty": 0}
-			by_item_group[group]["count"] += 1
-			by_item_group[group]["total_qty"] += item.get("actual_qty", 0)
+		total_items = sum(row.item_count for row in group_rows)
+		total_qty = sum(row.total_qty for row in group_rows)
+		items_with_stock = sum(row.items_with_stock for row in group_rows)
+
+		by_item_group = {
+			(row.item_group or "Unknown"): {"count": row.item_count, "total_qty": row.total_qty}
+			for row in group_rows
+		}
 
 		return {
 			"success": True,
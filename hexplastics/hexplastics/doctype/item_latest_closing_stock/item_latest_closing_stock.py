@@ -0,0 +1,120 @@
+# Copyright (c) 2026, beetashoke chakraborty and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import flt, getdate
+from frappe.model.document import Document
+
+
+class ItemLatestClosingStock(Document):
+	"""Denormalized snapshot of the most recent closing_stock per item.
+
+	Maintained from Production Log Book submit/cancel so the shift-priority
+	"previous closing stock" lookup becomes a single indexed read instead of
+	a 30-day JOIN scan.
+	"""
+
+	pass
+
+
+def _shift_rank(shift_type):
+	"""Rank a shift within one date: Night counts as later than Day."""
+	return 1 if (shift_type or "").strip().lower() == "night" else 0
+
+
+def update_from_production_log_book(doc, method=None):
+	"""DocEvent hook (on_submit): upsert snapshots from a submitted PLB.
+
+	A snapshot row is only overwritten when the submitted document is at
+	least as recent as the stored one per the priority rule
+	(production_date, then Night after Day).
+	"""
+	for row in doc.get("material_consumption") or []:
+		if not row.item_code or row.closing_stock is None:
+			continue
+		_upsert_snapshot(row.item_code, doc, flt(row.closing_stock))
+
+
+def _upsert_snapshot(item_code, doc, closing_stock):
+	"""Insert or update the snapshot row for one item."""
+	existing = frappe.db.get_value(
+		"Item Latest Closing Stock",
+		{"item_code": item_code},
+		["name", "production_date", "shift_type"],
+		as_dict=True,
+	)
+
+	values = {
+		"plb_name": doc.name,
+		"production_date": doc.production_date,
+		"shift_type": doc.shift_type,
+		"closing_stock": closing_stock,
+	}
+
+	if existing:
+		new_key = (getdate(doc.production_date), _shift_rank(doc.shift_type))
+		old_key = (getdate(existing.production_date), _shift_rank(existing.shift_type))
+		if new_key < old_key:
+			# A newer document already holds the snapshot — keep it
+			return
+		frappe.db.set_value("Item Latest Closing Stock", existing.name, values)
+	else:
+		snapshot = frappe.new_doc("Item Latest Closing Stock")
+		snapshot.item_code = item_code
+		snapshot.update(values)
+		snapshot.insert(ignore_permissions=True)
+
+
+def recompute_on_cancel(doc, method=None):
+	"""DocEvent hook (on_cancel): re-derive snapshots that pointed at doc.
+
+	Only items whose snapshot references the cancelled document are touched;
+	each is recomputed from the next-most-recent submitted PLB row, or the
+	snapshot is deleted when no other source exists.
+	"""
+	stale_snapshots = frappe.get_all(
+		"Item Latest Closing Stock",
+		filters={"plb_name": doc.name},
+		fields=["name", "item_code"],
+	)
+
+	for snapshot in stale_snapshots:
+		rows = frappe.db.sql(
+			"""
+			SELECT parent.name, parent.production_date, parent.shift_type,
+				child.closing_stock
+			FROM `tabProduction Log Book Table` child
+			INNER JOIN `tabProduction Log Book` parent
+				ON child.parent = parent.name
+			WHERE child.item_code = %(item_code)s
+				AND child.closing_stock IS NOT NULL
+				AND parent.docstatus = 1
+				AND parent.name != %(exclude_docname)s
+			ORDER BY
+				parent.production_date DESC,
+				CASE parent.shift_type WHEN 'Night' THEN 0 WHEN 'Day' THEN 1 ELSE 2 END ASC,
+				parent.creation DESC
+			LIMIT 1
+			""",
+			{"item_code": snapshot.item_code, "exclude_docname": doc.name},
+			as_dict=True,
+		)
+
+		if rows:
+			frappe.db.set_value(
+				"Item Latest Closing Stock",
+				snapshot.name,
+				{
+					"plb_name": rows[0].name,
+					"production_date": rows[0].production_date,
+					"shift_type": rows[0].shift_type,
+					"closing_stock": flt(rows[0].closing_stock),
+				},
+			)
+		else:
+			frappe.delete_doc(
+				"Item Latest Closing Stock",
+				snapshot.name,
+				ignore_permissions=True,
+				force=True,
+			)
@@ -142,15 +142,10 @@ frappe.ui.form.on("Production Log Book", {
 							}, 200);
 						}, 400);
 
-						// Fetch opening stock (previous closing_stock) for all items
-						// This must be done after items are added to the table
-						fill_opening_stock_for_items(frm);
-
-						// Also fetch hopper opening quantity using same shift-based logic
-						fill_hopper_opening_qty(frm);
-
-						// Also fetch MIP opening quantity using same shift-based logic
-						fill_mip_opening_qty(frm);
+						// Fetch item opening stock, hopper opening and MIP opening
+						// in one combined server call (must run after items are
+						// added to the table)
+						fill_previous_openings(frm, { items: true, hopper: true, mip: true });
 
 						// After BOM items are loaded, recalculate issued if qty_to_manufacture is present
 						recalculate_issued_for_material_consumption(frm);
@@ -211,34 +206,30 @@ frappe.ui.form.on("Production Log Book", {
 
 	// Trigger recalculation when production_date changes
 	production_date: function (frm) {
-		// Refetch opening stock when date changes
-		if (frm.doc.bom) {
-			if (frm.doc.material_consumption && frm.doc.material_consumption.length > 0) {
-				fill_opening_stock_for_items(frm);
-			}
-
-			// Also refetch hopper opening qty (depends on BOM-based process)
-			fill_hopper_opening_qty(frm);
-		}
-
-		// MIP opening does NOT depend on BOM; always refetch based on previous shift
-		fill_mip_opening_qty(frm);
+		// Refetch all openings with one combined call when date changes.
+		// Item opening stock and hopper opening depend on the BOM-based
+		// process; MIP opening is always refetched based on previous shift.
+		fill_previous_openings(frm, {
+			items: Boolean(
+				frm.doc.bom && frm.doc.material_consumption && frm.doc.material_consumption.length > 0
+			),
+			hopper: Boolean(frm.doc.bom),
+			mip: true,
+		});
 	},
 
 	// Trigger recalculation when shift_type changes
 	shift_type: function (frm) {
-		// Refetch opening stock when shift changes
-		if (frm.doc.bom) {
-			if (frm.doc.material_consumption && frm.doc.material_consumption.length > 0) {
-				fill_opening_stock_for_items(frm);
-			}
-
-			// Also refetch hopper opening qty (depends on BOM-based process)
-			fill_hopper_opening_qty(frm);
-		}
-
-		// MIP opening does NOT depend on BOM; always refetch based on previous shift
-		fill_mip_opening_qty(frm);
+		// Refetch all openings with one combined call when shift changes.
+		// Item opening stock and hopper opening depend on the BOM-based
+		// process; MIP opening is always refetched based on previous shift.
+		fill_previous_openings(frm, {
+			items: Boolean(
+				frm.doc.bom && frm.doc.material_consumption && frm.doc.material_consumption.length > 0
+			),
+			hopper: Boolean(frm.doc.bom),
+			mip: true,
+		});
 	},
 
 	// Trigger recalculation when qty_to_manufacture changes
@@ -2439,184 +2430,133 @@ function calculate_net_weight(frm) {
 }
 
 /**
- * Fill opening_opp_in_plant field for all items in material_consumption table
- * based on shift-based priority logic (previous closing_stock).
+ * Fill item opening stock, hopper opening qty and MIP opening qty using a
+ * single combined server call based on shift-based priority logic.
  *
- * This function:
- * 1. Collects all item_codes from material_consumption table
- * 2. Calls server-side API to get previous closing_stock for each item
- * 3. Sets opp_in_plant field for each row
+ * This replaces the three separate calls (get_opening_stock_for_items,
+ * get_previous_hopper_opening_qty, get_previous_mip_opening_qty) which each
+ * repeated the same previous-document scan on the server.
  *
  * @param {Object} frm - The form object
+ * @param {Object} opts - Which openings to fetch/apply:
+ *   {items: bool, hopper: bool, mip: bool}
  */
-function fill_opening_stock_for_items(frm) {
-	// Check if required fields are present
-	if (!frm.doc.production_date || !frm.doc.shift_type) {
-		// Cannot fetch opening stock without date and shift
-		return;
-	}
+function fill_previous_openings(frm, opts) {
+	opts = opts || {};
 
-	// Get all item codes from material_consumption table
-	const material_consumption = frm.doc.material_consumption || [];
-	if (material_consumption.length === 0) {
+	// Cannot fetch openings without date and shift
+	if (!frm.doc.production_date || !frm.doc.shift_type) {
 		return;
 	}
 
 	// Collect unique item codes (only for BOM items, not main/scrap items, and not PRIME items)
-	const item_codes = [];
-	material_consumption.forEach(function (row) {
-		if (row.item_code && row.item_type === "BOM Item" && !is_PRIME_item(row)) {
-			item_codes.push(row.item_code);
-		}
-	});
+	let item_codes = [];
+	if (opts.items) {
+		const material_consumption = frm.doc.material_consumption || [];
+		material_consumption.forEach(function (row) {
+			if (row.item_code && row.item_type === "BOM Item" && !is_PRIME_item(row)) {
+				item_codes.push(row.item_code);
+			}
+		});
+	}
 
-	if (item_codes.length === 0) {
+	if (!item_codes.length && !opts.hopper && !opts.mip) {
 		return;
 	}
 
-	// Call server-side API to get opening stock for all items at once
 	frappe.call({
-		method: "hexplastics.api.production_log_book.get_opening_stock_for_items",
+		method: "hexplastics.api.production_log_book.get_previous_openings",
 		args: {
-			item_codes: item_codes,
 			current_date: frm.doc.production_date,
 			current_shift: frm.doc.shift_type,
+			item_codes: item_codes,
 			exclude_docname: frm.doc.name || null, // Exclude current document if it exists
 		},
 		callback: function (r) {
-			if (r.message && typeof r.message === "object") {
-				const opening_stock_map = r.message;
+			if (!r.message || typeof r.message !== "object") {
+				return;
+			}
 
-				// Update opp_in_plant for each row (exclude PRIME items - they don't use opening stock)
-				material_consumption.forEach(function (row) {
-					if (
-						row.item_code &&
-						row.item_type === "BOM Item" &&
-						!is_PRIME_item(row) &&
-						opening_stock_map[row.item_code] !== undefined
-					) {
-						// Only set if value exists in the map
-						const opening_stock = flt(opening_stock_map[row.item_code]) || 0;
-
-						// Use frappe.model.set_value to update the field
-						frappe.model.set_value(
-							row.doctype,
-							row.name,
-							"opp_in_plant",
-							opening_stock
-						);
-					}
-				});
+			if (item_codes.length) {
+				apply_opening_stock_map(frm, r.message.items || {});
+			}
 
-				// Refresh the field to show updated values
-				frm.refresh_field("material_consumption");
+			if (opts.hopper) {
+				// Support both possible fieldnames for hopper opening qty
+				apply_parent_opening_qty(frm, r.message.closing_qty, [
+					"hopper_opening_qty", // if a dedicated field exists
+					"opening_qty_in_hopper_and_tray", // current fieldname in DocType
+				]);
+			}
+
+			if (opts.mip) {
+				// Support both possible fieldnames for MIP opening qty
+				apply_parent_opening_qty(frm, r.message.closing_qty_mip, [
+					"mip_opening_qty",
+					"opening_qty_mip",
+				]);
 			}
 		},
 		error: function (r) {
 			// Log error but don't break the form
-			console.error("Error fetching opening stock:", r);
+			console.error("Error fetching previous openings:", r);
 		},
 	});
 }
 
 /**
- * Fill hopper opening quantity on the parent document using the same
- * shift-based priority logic as item-wise opening stock.
- *
- * This uses the previous document's hopper closing_qty as opening.
+ * Apply an {item_code: opening_stock} map to the material_consumption rows.
  *
  * @param {Object} frm - The form object
+ * @param {Object} opening_stock_map - Map of item_code to opening stock value
  */
-function fill_hopper_opening_qty(frm) {
-	// Require production_date and shift_type
-	if (!frm.doc.production_date || !frm.doc.shift_type) {
-		return;
-	}
-
-	// Call server-side API to get previous hopper closing quantity
-	frappe.call({
-		method: "hexplastics.api.production_log_book.get_previous_hopper_opening_qty",
-		args: {
-			current_date: frm.doc.production_date,
-			current_shift: frm.doc.shift_type,
-			exclude_docname: frm.doc.name || null, // Exclude current document if it exists
-		},
-		callback: function (r) {
-			if (r.message === undefined || r.message === null) {
-				return;
-			}
-
-			const opening_qty = flt(r.message) || 0;
-
-			// Support both possible fieldnames for hopper opening qty
-			const hopper_fields = [
-				"hopper_opening_qty", // if a dedicated field exists
-				"opening_qty_in_hopper_and_tray", // current fieldname in DocType
-			];
+function apply_opening_stock_map(frm, opening_stock_map) {
+	const material_consumption = frm.doc.material_consumption || [];
 
-			hopper_fields.forEach(function (fieldname) {
-				if (frm.fields_dict[fieldname]) {
-					const current_value = flt(frm.doc[fieldname]) || 0;
+	// Update opp_in_plant for each row (exclude PRIME items - they don't use opening stock)
+	material_consumption.forEach(function (row) {
+		if (
+			row.item_code &&
+			row.item_type === "BOM Item" &&
+			!is_PRIME_item(row) &&
+			opening_stock_map[row.item_code] !== undefined
+		) {
+			// Only set if value exists in the map
+			const opening_stock = flt(opening_stock_map[row.item_code]) || 0;
 
-					// Only auto-fill when the field is empty/zero to avoid
-					// overwriting user edits after initial fill.
-					if (!current_value) {
-						frm.set_value(fieldname, opening_qty);
-					}
-				}
-			});
-		},
-		error: function (r) {
-			// Log error but don't break the form
-			console.error("Error fetching hopper opening qty:", r);
-		},
+			// Use frappe.model.set_value to update the field
+			frappe.model.set_value(row.doctype, row.name, "opp_in_plant", opening_stock);
+		}
 	});
+
+	// Refresh the field to show updated values
+	frm.refresh_field("material_consumption");
 }
 
 /**
- * Fill MIP opening quantity on the parent document using the same
- * shift-based priority logic as hopper and item-wise opening stock.
- *
- * This uses the previous document's closing_qty_mip as opening.
+ * Apply a parent-level opening quantity to the first matching fieldname.
  *
  * @param {Object} frm - The form object
+ * @param {Number} value - Opening quantity from the previous document
+ * @param {Array} fieldnames - Candidate fieldnames to fill
  */
-function fill_mip_opening_qty(frm) {
-	// Require production_date and shift_type
-	if (!frm.doc.production_date || !frm.doc.shift_type) {
+function apply_parent_opening_qty(frm, value, fieldnames) {
+	if (value === undefined || value === null) {
 		return;
 	}
 
-	frappe.call({
-		method: "hexplastics.api.production_log_book.get_previous_mip_opening_qty",
-		args: {
-			current_date: frm.doc.production_date,
-			current_shift: frm.doc.shift_type,
-			exclude_docname: frm.doc.name || null,
-		},
-		callback: function (r) {
-			if (r.message === undefined || r.message === null) {
-				return;
-			}
-
-			const opening_qty = flt(r.message) || 0;
+	const opening_qty = flt(value) || 0;
 
-			// Support both possible fieldnames for MIP opening qty
-			const mip_fields = ["mip_opening_qty", "opening_qty_mip"];
+	fieldnames.forEach(function (fieldname) {
+		if (frm.fields_dict[fieldname]) {
+			const current_value = flt(frm.doc[fieldname]) || 0;
 
-			mip_fields.forEach(function (fieldname) {
-				if (frm.fields_dict[fieldname]) {
-					const current_value = flt(frm.doc[fieldname]) || 0;
-					// Only auto-fill when empty/zero so user edits are preserved
-					if (!current_value) {
-						frm.set_value(fieldname, opening_qty);
-					}
-				}
-			});
-		},
-		error: function (r) {
-			console.error("Error fetching MIP opening qty:", r);
-		},
+			// Only auto-fill when the field is empty/zero to avoid
+			// overwriting user edits after initial fill.
+			if (!current_value) {
+				frm.set_value(fieldname, opening_qty);
+			}
+		}
 	});
 }
 
@@ -0,0 +1,76 @@
+# Copyright (c) 2026, beetashoke chakraborty and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import flt
+from frappe.model.document import Document
+
+
+class ProductionLogSheetDailyRollup(Document):
+	"""Pre-summed Production Log Sheet aggregates per (date, shift).
+
+	Submitted log sheets are immutable, so their sums never change once
+	written. The submit/cancel hooks keep this table current and the
+	dashboard reads it for unfiltered item/grade queries instead of
+	rescanning every submitted sheet and its FG child rows.
+	"""
+
+	pass
+
+
+def _doc_contribution(doc):
+	"""Compute the rollup deltas contributed by one Production Log Sheet."""
+	gross_weight = 0.0
+	net_weight = 0.0
+	for row in doc.get("table_foun") or []:
+		gross_weight += flt(row.gross_weight)
+		net_weight += flt(row.net_weight)
+
+	return {
+		"sum_gross_weight": gross_weight,
+		"sum_net_weight": net_weight,
+		"sum_process_loss": flt(doc.process_loss_weight),
+		"sum_mip": flt(doc.mip_used),
+		"sum_rm": flt(doc.total_rm_consumption),
+	}
+
+
+def _apply_contribution(doc, sign):
+	"""Add (+1) or remove (-1) a document's contribution to its rollup row."""
+	key = {
+		"production_date": doc.production_date,
+		"shift_type": doc.shift_type,
+	}
+	contribution = _doc_contribution(doc)
+
+	existing = frappe.db.get_value("Production Log Sheet Daily Rollup", key, "name")
+
+	if existing:
+		assignments = ", ".join(
+			f"`{field}` = `{field}` + %({field})s" for field in contribution
+		)
+		values = {field: sign * delta for field, delta in contribution.items()}
+		values["name"] = existing
+		frappe.db.sql(
+			"""
+			UPDATE `tabProduction Log Sheet Daily Rollup`
+			SET {assignments}
+			WHERE name = %(name)s
+		""".format(assignments=assignments),
+			values,
+		)
+	elif sign > 0:
+		rollup = frappe.new_doc("Production Log Sheet Daily Rollup")
+		rollup.update(key)
+		rollup.update(contribution)
+		rollup.insert(ignore_permissions=True)
+
+
+def update_rollup_on_submit(doc, method=None):
+	"""DocEvent hook (on_submit): accumulate this sheet into the rollup."""
+	_apply_contribution(doc, 1)
+
+
+def update_rollup_on_cancel(doc, method=None):
+	"""DocEvent hook (on_cancel): remove this sheet from the rollup."""
+	_apply_contribution(doc, -1)
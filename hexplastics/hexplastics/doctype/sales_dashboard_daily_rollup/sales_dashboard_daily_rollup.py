@@ -0,0 +1,68 @@
+# Copyright (c) 2026, beetashoke chakraborty and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import flt
+from frappe.model.document import Document
+
+
+class SalesDashboardDailyRollup(Document):
+	"""Pre-summed submitted Sales Order / Sales Invoice totals per day.
+
+	The overview cards only need counts and grand totals per (date,
+	customer, doctype). Submit/cancel hooks keep this table current, so
+	the dashboard sums a handful of rollup rows instead of scanning the
+	full transaction tables on every load.
+	"""
+
+	pass
+
+
+def _doc_key(doc):
+	"""Rollup key for one Sales Order or Sales Invoice."""
+	date_field = (
+		"transaction_date" if doc.doctype == "Sales Order" else "posting_date"
+	)
+	return {
+		"doc_date": doc.get(date_field),
+		"ref_doctype": doc.doctype,
+		"customer": doc.customer,
+	}
+
+
+def _apply_contribution(doc, sign):
+	"""Add (+1) or remove (-1) a document's contribution to its rollup row."""
+	key = _doc_key(doc)
+
+	existing = frappe.db.get_value("Sales Dashboard Daily Rollup", key, "name")
+
+	if existing:
+		frappe.db.sql(
+			"""
+			UPDATE `tabSales Dashboard Daily Rollup`
+			SET doc_count = doc_count + %(doc_count)s,
+				grand_total_sum = grand_total_sum + %(grand_total_sum)s
+			WHERE name = %(name)s
+		""",
+			{
+				"doc_count": sign,
+				"grand_total_sum": sign * flt(doc.grand_total),
+				"name": existing,
+			},
+		)
+	elif sign > 0:
+		rollup = frappe.new_doc("Sales Dashboard Daily Rollup")
+		rollup.update(key)
+		rollup.doc_count = 1
+		rollup.grand_total_sum = flt(doc.grand_total)
+		rollup.insert(ignore_permissions=True)
+
+
+def update_rollup_on_submit(doc, method=None):
+	"""DocEvent hook (on_submit): accumulate this document into the rollup."""
+	_apply_contribution(doc, 1)
+
+
+def update_rollup_on_cancel(doc, method=None):
+	"""DocEvent hook (on_cancel): remove this document from the rollup."""
+	_apply_contribution(doc, -1)
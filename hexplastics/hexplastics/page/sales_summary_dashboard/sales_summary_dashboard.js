@@ -99,11 +99,9 @@ class SalesSummaryDashboard {
 		
 		// 1. Bind events (no setTimeout wrapper needed now)
 		this.bindEventsImmediate();
-		
-		// 2. Load filter options
-		this.load_filter_options();
-		
-		// 3. Fetch data on initial load (without date filters - will show all data)
+
+		// 2. Fetch data on initial load (without date filters - will show all data);
+		// the bundle payload also carries the filter options
 		this.refresh_data();
 	}
 
@@ -258,7 +256,7 @@ class SalesSummaryDashboard {
 			self.refresh_sales_invoices();
 		});
 
-		// Note: Autocomplete setup is now done in load_filter_options callback
+		// Note: Autocomplete setup is now done in apply_filter_options
 		// to ensure data is loaded before setting up autocomplete
 
 	}
@@ -544,30 +542,23 @@ class SalesSummaryDashboard {
 		});
 	}
 
-	load_filter_options() {
+	apply_filter_options(options) {
 		const self = this;
 
-		frappe.call({
-			method: "hexplastics.api.sales_summary_dashboard.get_filter_options",
-			async: true,
-			callback: function (r) {
-				if (r.message) {
-					self.customers = r.message.customers || [];
-					self.items = r.message.items || [];
-					self.sales_order_ids = r.message.sales_order_ids || [];
-					self.sales_invoice_ids = r.message.sales_invoice_ids || [];
-					
-					// Setup autocomplete after data is loaded
-					setTimeout(() => {
-						self.setup_customer_autocomplete();
-						self.setup_item_autocomplete("so-item-filter", "so-item-filter-wrapper");
-						self.setup_item_autocomplete("si-item-filter", "si-item-filter-wrapper");
-						self.setup_id_autocomplete("so-id-filter", "so-id-filter");
-						self.setup_id_autocomplete("si-id-filter", "si-id-filter");
-					}, 100);
-				}
-			},
-		});
+		self.customers = options.customers || [];
+		self.items = options.items || [];
+		self.sales_order_ids = options.sales_order_ids || [];
+		self.sales_invoice_ids = options.sales_invoice_ids || [];
+		self.filter_options_loaded = true;
+
+		// Setup autocomplete after data is loaded
+		setTimeout(() => {
+			self.setup_customer_autocomplete();
+			self.setup_item_autocomplete("so-item-filter", "so-item-filter-wrapper");
+			self.setup_item_autocomplete("si-item-filter", "si-item-filter-wrapper");
+			self.setup_id_autocomplete("so-id-filter", "so-id-filter");
+			self.setup_id_autocomplete("si-id-filter", "si-id-filter");
+		}, 100);
 	}
 
 	switch_tab(tabId) {
@@ -626,14 +617,38 @@ class SalesSummaryDashboard {
 		this.refreshing = true;
 
 		const self = this;
-		const filters = this.get_global_filters();
+		const soFilters = this.get_sales_order_filters();
+		const siFilters = this.get_sales_invoice_filters();
 
+		// One bundled request replaces the four separate calls on load and
+		// refresh; the payload fans out to the existing update functions
 		frappe.call({
-			method: "hexplastics.api.sales_summary_dashboard.get_overview_data",
-			args: filters,
+			method: "hexplastics.api.sales_summary_dashboard.get_dashboard_bundle",
+			args: {
+				from_date: soFilters.from_date,
+				to_date: soFilters.to_date,
+				customer: soFilters.customer,
+				so_status: soFilters.status,
+				order_id: soFilters.order_id,
+				so_item: soFilters.item,
+				si_status: siFilters.status,
+				invoice_id: siFilters.invoice_id,
+				si_item: siFilters.item,
+			},
 			callback: function (r) {
 				if (r.message) {
-					self.update_overview(r.message);
+					self.update_overview(r.message.overview);
+					if (r.message.sales_orders) {
+						self.update_sales_order_metrics(r.message.sales_orders.metrics);
+						self.update_sales_order_table(r.message.sales_orders.orders);
+					}
+					if (r.message.sales_invoices) {
+						self.update_sales_invoice_metrics(r.message.sales_invoices.metrics);
+						self.update_sales_invoice_table(r.message.sales_invoices.invoices);
+					}
+					if (!self.filter_options_loaded && r.message.filters) {
+						self.apply_filter_options(r.message.filters);
+					}
 				}
 				self.refreshing = false;
 			},
@@ -642,14 +657,6 @@ class SalesSummaryDashboard {
 				self.refreshing = false;
 			},
 		});
-
-		// Also refresh the current tab if not overview (but don't duplicate if already refreshing)
-		const activeTab = this.wrapper.find(".tab-btn.active").data("tab");
-		if (activeTab === "sales-order") {
-			this.refresh_sales_orders();
-		} else if (activeTab === "sales-invoice") {
-			this.refresh_sales_invoices();
-		}
 	}
 
 	refresh_sales_orders() {
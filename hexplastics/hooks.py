@@ -253,6 +253,63 @@ fixtures = [{"doctype": "Custom Field", "filters": {"module": "Hexplastics"}}]
 
 doc_events = {
     "Production Log Book": {
-        "on_submit": "hexplastics.hexplastics.doctype.production_log_book.production_log_book.on_production_log_book_submit",
-    }
+        "on_submit": [
+            "hexplastics.hexplastics.doctype.production_log_book.production_log_book.on_production_log_book_submit",
+            "hexplastics.hexplastics.doctype.item_latest_closing_stock.item_latest_closing_stock.update_from_production_log_book",
+            "hexplastics.hexplastics.doctype.production_log_book_daily_summary.production_log_book_daily_summary.update_summary_on_submit",
+            "hexplastics.api.production_log_dashboard.clear_dashboard_cache",
+        ],
+        "on_cancel": [
+            "hexplastics.hexplastics.doctype.item_latest_closing_stock.item_latest_closing_stock.recompute_on_cancel",
+            "hexplastics.hexplastics.doctype.production_log_book_daily_summary.production_log_book_daily_summary.update_summary_on_cancel",
+            "hexplastics.api.production_log_dashboard.clear_dashboard_cache",
+        ],
+        "on_update_after_submit": "hexplastics.api.production_log_dashboard.clear_dashboard_cache",
+    },
+    "Production Log Sheet": {
+        "on_submit": [
+            "hexplastics.hexplastics.doctype.production_log_sheet_daily_rollup.production_log_sheet_daily_rollup.update_rollup_on_submit",
+            "hexplastics.api.production_log_sheet_dashboard.clear_dashboard_cache",
+        ],
+        "on_cancel": [
+            "hexplastics.hexplastics.doctype.production_log_sheet_daily_rollup.production_log_sheet_daily_rollup.update_rollup_on_cancel",
+            "hexplastics.api.production_log_sheet_dashboard.clear_dashboard_cache",
+        ],
+    },
+    "BOM": {
+        "on_submit": "hexplastics.api.production_log_sheet_dashboard.clear_bom_rm_cache",
+        "on_cancel": "hexplastics.api.production_log_sheet_dashboard.clear_bom_rm_cache",
+    },
+    "Customer": {
+        "on_update": "hexplastics.api.sales_summary_dashboard.clear_filter_options_cache",
+        "on_trash": "hexplastics.api.sales_summary_dashboard.clear_filter_options_cache",
+    },
+    "Item": {
+        "on_update": "hexplastics.api.sales_summary_dashboard.clear_filter_options_cache",
+        "on_trash": "hexplastics.api.sales_summary_dashboard.clear_filter_options_cache",
+    },
+    "Sales Order": {
+        "on_submit": [
+            "hexplastics.hexplastics.doctype.sales_dashboard_daily_rollup.sales_dashboard_daily_rollup.update_rollup_on_submit",
+            "hexplastics.api.sales_summary_dashboard.clear_overview_cache",
+        ],
+        "on_cancel": [
+            "hexplastics.hexplastics.doctype.sales_dashboard_daily_rollup.sales_dashboard_daily_rollup.update_rollup_on_cancel",
+            "hexplastics.api.sales_summary_dashboard.clear_overview_cache",
+        ],
+    },
+    "Sales Invoice": {
+        "on_submit": [
+            "hexplastics.hexplastics.doctype.sales_dashboard_daily_rollup.sales_dashboard_daily_rollup.update_rollup_on_submit",
+            "hexplastics.api.sales_summary_dashboard.clear_overview_cache",
+        ],
+        "on_cancel": [
+            "hexplastics.hexplastics.doctype.sales_dashboard_daily_rollup.sales_dashboard_daily_rollup.update_rollup_on_cancel",
+            "hexplastics.api.sales_summary_dashboard.clear_overview_cache",
+        ],
+    },
+    "Purchase Order": {
+        "on_submit": "hexplastics.api.purchase_order.clear_avg_rate_cache",
+        "on_cancel": "hexplastics.api.purchase_order.clear_avg_rate_cache",
+    },
 }
@@ -0,0 +1,28 @@
+import frappe
+
+
+def execute():
+    """Add covering indexes for the Production Log Book dashboard queries.
+
+    Every dashboard statement filters docstatus = 1 with a production_date
+    range plus optional shift_type/manufacturing_item, and the entries list
+    orders by production_date, production_time; idx_plb_dash covers the
+    WHERE and the ORDER BY. idx_plbt_parent_type makes the BOM-Item
+    consumption SUM on the child table index-only.
+    """
+    frappe.db.add_index(
+        "Production Log Book",
+        [
+            "docstatus",
+            "production_date",
+            "shift_type",
+            "manufacturing_item",
+            "production_time",
+        ],
+        "idx_plb_dash",
+    )
+    frappe.db.add_index(
+        "Production Log Book Table",
+        ["parent", "item_type", "consumption"],
+        "idx_plbt_parent_type",
+    )
@@ -0,0 +1,16 @@
+import frappe
+
+
+def execute():
+    """Align an index with the shift-priority ORDER BY to avoid filesort.
+
+    The previous-document queries order by production_date DESC, shift_type
+    priority and creation DESC with LIMIT 1; including creation in the
+    composite lets the engine walk the index backwards and stop at the first
+    row instead of sorting the candidate set on every probe.
+    """
+    frappe.db.add_index(
+        "Production Log Book",
+        ["production_date", "shift_type", "docstatus", "creation"],
+        "plb_priority_idx",
+    )
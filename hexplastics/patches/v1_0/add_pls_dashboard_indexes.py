@@ -0,0 +1,35 @@
+import frappe
+
+
+def execute():
+    """Add covering indexes for the Production Log Sheet dashboard queries.
+
+    Every dashboard statement filters docstatus = 1 with a production_date
+    range plus optional shift_type; idx_pls_dash covers that WHERE and
+    idx_pls_order the entries ORDER BY. The FG child index serves the
+    EXISTS probes on (parent, manufacturing_item) and the Production Plan
+    Item index the bulk parent IN fetch in actual vs planned.
+
+    Manufacturing item lives on the FG child table, not the parent, so the
+    parent index stops at shift_type.
+    """
+    frappe.db.add_index(
+        "Production Log Sheet",
+        ["docstatus", "production_date", "shift_type"],
+        "idx_pls_dash",
+    )
+    frappe.db.add_index(
+        "Production Log Sheet",
+        ["production_date", "production_time"],
+        "idx_pls_order",
+    )
+    frappe.db.add_index(
+        "Production Log Sheet FG Details Table",
+        ["parent", "manufacturing_item"],
+        "idx_plsfg_parent_item",
+    )
+    frappe.db.add_index(
+        "Production Plan Item",
+        ["parent", "docstatus"],
+        "idx_ppi_parent_ds",
+    )
@@ -0,0 +1,21 @@
+import frappe
+
+
+def execute():
+    """Index the FG child columns behind the filter-option DISTINCT scans.
+
+    get_filter_options takes DISTINCT manufacturing_item and bom_name from
+    `tabProduction Log Sheet FG Details Table`; leading indexes on those
+    columns let MariaDB answer with a loose index scan on the cold path
+    (the warm path is the Redis-cached options list).
+    """
+    frappe.db.add_index(
+        "Production Log Sheet FG Details Table",
+        ["manufacturing_item"],
+        "idx_plsfg_item",
+    )
+    frappe.db.add_index(
+        "Production Log Sheet FG Details Table",
+        ["bom_name"],
+        "idx_plsfg_bom_name",
+    )
@@ -0,0 +1,21 @@
+import frappe
+
+
+def execute():
+    """Add composite indexes for the Production Log Book shift-priority lookups.
+
+    The previous-closing-stock / hopper / MIP queries filter on
+    (production_date, shift_type, docstatus) on the parent and
+    (parent, item_code) on the child table; without these composite
+    indexes each probe falls back to a range/table scan.
+    """
+    frappe.db.add_index(
+        "Production Log Book",
+        ["production_date", "shift_type", "docstatus"],
+        "plb_date_shift_ds",
+    )
+    frappe.db.add_index(
+        "Production Log Book Table",
+        ["parent", "item_code"],
+        "plbt_parent_item",
+    )
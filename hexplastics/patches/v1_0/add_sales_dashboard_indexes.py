@@ -0,0 +1,32 @@
+import frappe
+
+
+def execute():
+    """Add covering composite indexes for the sales dashboard queries.
+
+    Every dashboard statement filters docstatus (and usually status) with
+    an optional date range and customer, then reads grand_total. Putting
+    grand_total at the tail lets the metrics aggregates answer from the
+    index alone; the customer-leading variants serve customer-filtered
+    loads where status is unconstrained.
+    """
+    frappe.db.add_index(
+        "Sales Order",
+        ["docstatus", "status", "transaction_date", "customer", "grand_total"],
+        "idx_so_dashboard",
+    )
+    frappe.db.add_index(
+        "Sales Order",
+        ["docstatus", "customer", "transaction_date"],
+        "idx_so_customer_date",
+    )
+    frappe.db.add_index(
+        "Sales Invoice",
+        ["docstatus", "status", "posting_date", "customer", "grand_total"],
+        "idx_si_dashboard",
+    )
+    frappe.db.add_index(
+        "Sales Invoice",
+        ["docstatus", "customer", "posting_date"],
+        "idx_si_customer_date",
+    )
@@ -0,0 +1,20 @@
+import frappe
+
+
+def execute():
+    """Index (item_code, parent) on the sales item child tables.
+
+    The dashboard item filter probes the child tables with EXISTS on
+    item_code equality; these indexes turn that probe into an index range
+    seek that also covers the parent back-reference.
+    """
+    frappe.db.add_index(
+        "Sales Order Item",
+        ["item_code", "parent"],
+        "idx_soi_item_parent",
+    )
+    frappe.db.add_index(
+        "Sales Invoice Item",
+        ["item_code", "parent"],
+        "idx_sii_item_parent",
+    )
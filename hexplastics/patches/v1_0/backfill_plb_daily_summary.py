@@ -0,0 +1,48 @@
+import frappe
+
+
+def execute():
+    """Backfill Production Log Book Daily Summary from submitted log books.
+
+    The summary table is maintained incrementally by submit/cancel hooks;
+    this patch seeds it from the Production Log Books that were submitted
+    before the hooks existed. Idempotent: the table is truncated first so
+    re-running rebuilds a consistent snapshot.
+    """
+    frappe.db.delete("Production Log Book Daily Summary")
+
+    rows = frappe.db.sql(
+        """
+        SELECT
+            pl.production_date,
+            pl.shift_type,
+            COALESCE(pl.manufacturing_item, '') AS manufacturing_item,
+            SUM(pl.manufactured_qty) AS manufactured_qty,
+            SUM(pl.gross_weight) AS gross_weight,
+            SUM(pl.net_weight) AS net_weight,
+            SUM(pl.manufactured_qty * COALESCE(item.weight_per_unit, 0)) AS standard_weight,
+            SUM(pl.process_loss_weight) AS process_loss_weight,
+            SUM(pl.mip_used) AS mip_used,
+            SUM(pl.add_or_used) AS add_or_used,
+            COALESCE(SUM(child.total_consumption), 0) AS total_consumption,
+            COALESCE(SUM(child.total_rm_consumption), 0) AS total_rm_consumption
+        FROM `tabProduction Log Book` pl
+        LEFT JOIN `tabItem` item ON item.name = pl.manufacturing_item
+        LEFT JOIN (
+            SELECT
+                parent,
+                SUM(consumption) AS total_consumption,
+                SUM(CASE WHEN item_type = 'BOM Item' THEN consumption ELSE 0 END) AS total_rm_consumption
+            FROM `tabProduction Log Book Table`
+            GROUP BY parent
+        ) child ON child.parent = pl.name
+        WHERE pl.docstatus = 1
+        GROUP BY pl.production_date, pl.shift_type, COALESCE(pl.manufacturing_item, '')
+    """,
+        as_dict=True,
+    )
+
+    for row in rows:
+        summary = frappe.new_doc("Production Log Book Daily Summary")
+        summary.update(row)
+        summary.insert(ignore_permissions=True)
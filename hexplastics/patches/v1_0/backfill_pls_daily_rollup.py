@@ -0,0 +1,44 @@
+import frappe
+
+
+def execute():
+    """Backfill Production Log Sheet Daily Rollup from submitted sheets.
+
+    The rollup is maintained incrementally by submit/cancel hooks; this
+    patch seeds it from the Production Log Sheets that were submitted before
+    the hooks existed. Idempotent: the table is truncated first so
+    re-running rebuilds a consistent snapshot.
+    """
+    frappe.db.delete("Production Log Sheet Daily Rollup")
+
+    rows = frappe.db.sql(
+        """
+        SELECT
+            pls.production_date,
+            pls.shift_type,
+            COALESCE(SUM(fg_w.gross_weight_sum), 0) AS sum_gross_weight,
+            COALESCE(SUM(fg_w.net_weight_sum), 0) AS sum_net_weight,
+            COALESCE(SUM(pls.process_loss_weight), 0) AS sum_process_loss,
+            COALESCE(SUM(pls.mip_used), 0) AS sum_mip,
+            COALESCE(SUM(pls.total_rm_consumption), 0) AS sum_rm
+        FROM `tabProduction Log Sheet` pls
+        LEFT JOIN (
+            SELECT
+                parent,
+                SUM(gross_weight) AS gross_weight_sum,
+                SUM(net_weight) AS net_weight_sum
+            FROM `tabProduction Log Sheet FG Details Table`
+            WHERE parenttype = 'Production Log Sheet'
+                AND parentfield = 'table_foun'
+            GROUP BY parent
+        ) fg_w ON fg_w.parent = pls.name
+        WHERE pls.docstatus = 1
+        GROUP BY pls.production_date, pls.shift_type
+    """,
+        as_dict=True,
+    )
+
+    for row in rows:
+        rollup = frappe.new_doc("Production Log Sheet Daily Rollup")
+        rollup.update(row)
+        rollup.insert(ignore_permissions=True)
@@ -0,0 +1,36 @@
+import frappe
+
+
+def execute():
+    """Backfill Sales Dashboard Daily Rollup from submitted documents.
+
+    The rollup is maintained incrementally by submit/cancel hooks; this
+    patch seeds it from the Sales Orders and Sales Invoices submitted
+    before the hooks existed. Idempotent: the table is truncated first so
+    re-running rebuilds a consistent snapshot.
+    """
+    frappe.db.delete("Sales Dashboard Daily Rollup")
+
+    for ref_doctype, date_field in (
+        ("Sales Order", "transaction_date"),
+        ("Sales Invoice", "posting_date"),
+    ):
+        rows = frappe.db.sql(
+            """
+            SELECT
+                {date_field} AS doc_date,
+                customer,
+                COUNT(*) AS doc_count,
+                COALESCE(SUM(grand_total), 0) AS grand_total_sum
+            FROM `tab{ref_doctype}`
+            WHERE docstatus = 1
+            GROUP BY {date_field}, customer
+        """.format(ref_doctype=ref_doctype, date_field=date_field),
+            as_dict=True,
+        )
+
+        for row in rows:
+            rollup = frappe.new_doc("Sales Dashboard Daily Rollup")
+            rollup.ref_doctype = ref_doctype
+            rollup.update(row)
+            rollup.insert(ignore_permissions=True)
@@ -110,6 +110,55 @@ def get_all_items_stock_quantity(warehouse=None, item_group=None, include_zero_s
 	return stock_data
 
 
+def get_stock_summary_sql(warehouse=None, item_group=None):
+	"""
+	Get stock counts and quantities grouped by item group in a single query.
+
+	Aggregates Bin rows per item (optionally restricted to one warehouse),
+	joins enabled Items and groups by item_group — the same row set
+	get_all_items_stock_quantity produces with include_zero_stock=False,
+	but computed in SQL so Python only sees one row per item group.
+
+	Args:
+		warehouse: Optional warehouse filter.
+		item_group: Optional item group filter.
+
+	Returns:
+		list: Dicts with item_group, item_count, items_with_stock and total_qty.
+	"""
+	warehouse_filter = ""
+	item_group_filter = ""
+	params = {"warehouse": warehouse, "item_group": item_group}
+
+	if warehouse:
+		warehouse_filter = " AND warehouse = %(warehouse)s"
+	if item_group:
+		item_group_filter = " AND i.item_group = %(item_group)s"
+
+	return frappe.db.sql(
+		f"""
+		SELECT
+			i.item_group,
+			COUNT(*) AS item_count,
+			SUM(CASE WHEN b.qty > 0 THEN 1 ELSE 0 END) AS items_with_stock,
+			COALESCE(SUM(b.qty), 0) AS total_qty
+		FROM (
+			SELECT item_code, SUM(actual_qty) AS qty
+			FROM `tabBin`
+			WHERE 1 = 1 {warehouse_filter}
+			GROUP BY item_code
+		) b
+		INNER JOIN `tabItem` i ON i.name = b.item_code
+		WHERE i.disabled = 0
+			AND b.qty > 0
+			{item_group_filter}
+		GROUP BY i.item_group
+	""",
+		params,
+		as_dict=True,
+	)
+
+
 def get_item_stock_quantity(item_code, warehouse=None):
 	"""
 	Get stock quantity for a specific item.